@@ -17,17 +17,58 @@ from langchain.prompts import PromptTemplate
 from langchain.agents import AgentExecutor, create_openai_tools_agent
 from langchain_core.messages import BaseMessage, HumanMessage
 from langchain_openai import ChatOpenAI
-from langchain.output_parsers.openai_functions import JsonOutputFunctionsParser
 from langchain.output_parsers.openai_tools import JsonOutputToolsParser
+from langchain_core.runnables import Runnable, RunnableLambda, RunnablePassthrough
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.tools import BaseTool
+import asyncio
+import logging
 import operator
-from typing import Annotated, Sequence, TypedDict
+import re
+from typing import Annotated, Any, Optional, Sequence, TypedDict
 import functools
 from langgraph.graph import StateGraph, END
+from langgraph.checkpoint.memory import MemorySaver
+from cache import CacheManager
 from tools import *
 from prompts import *
 import os 
 
 
+logger = logging.getLogger(__name__)
+
+# Worker agents available to the supervisor
+MEMBERS = ["Analyzer", "Generator", "Searcher"]
+WORKER_NAMES = frozenset(MEMBERS)
+
+# Routing options (workers + finish command)
+OPTIONS = ["FINISH"] + MEMBERS
+
+# Supported LLM providers
+LLM_NAMES = ("openai", "groq", "llama3")
+
+# Upper bound on a single worker run (LLM calls + tool execution), so one
+# slow tool cannot stall the whole conversation
+AGENT_TIMEOUT_SECONDS = float(os.environ.get("AGENT_TIMEOUT_SECONDS", 120))
+
+# Keyword rules that route clear, single-intent user queries without an LLM
+# call. A query matching several rules (e.g. "find jobs that fit my CV") or
+# none is left to the supervisor LLM, which can plan multi-step work
+_ROUTER_RULES = (
+    (re.compile(r"\b(?:cv|resume|r[ée]sum[ée]|analy[sz]e)\b", re.IGNORECASE), "Analyzer"),
+    (re.compile(r"\b(?:jobs?|search|find|openings?|vacanc(?:y|ies)|positions?)\b", re.IGNORECASE), "Searcher"),
+)
+
+# Letter requests usually name a job too, so they are matched separately
+_LETTER_RULE = re.compile(r"\b(?:cover\s+)?letters?\b", re.IGNORECASE)
+
+# Build every provider's routing prompt at import; routing_prompt is
+# memoized, so define_graph gets these instances back without rebuilding
+for _llm_name in LLM_NAMES:
+    routing_prompt(_llm_name, OPTIONS, MEMBERS)
+del _llm_name
+
+
 class AgentState(TypedDict):
     """
     Defines the state structure shared across all agents in the graph.
@@ -36,19 +77,20 @@ class AgentState(TypedDict):
         input (str): Original user input/query
         messages (Annotated[Sequence[BaseMessage], operator.add]): 
             Chat history with automatic message accumulation
-        next (str): Next agent to execute (determined by supervisor)
+        next (Sequence[str]): Agents to execute next (determined by supervisor);
+            independent agents listed together run in parallel
     """
     input: str
     messages: Annotated[Sequence[BaseMessage], operator.add]
-    next: str
+    next: Sequence[str]
 
 
-def create_agent(llm: ChatOpenAI, tools: list, system_prompt: str) -> AgentExecutor:
+def create_agent(llm: Runnable, tools: list, system_prompt: str) -> AgentExecutor:
     """
     Factory function to create a specialized agent with specific tools and prompt.
     
     Args:
-        llm (ChatOpenAI): Language model instance
+        llm (Runnable): Language model instance, optionally with bound kwargs
         tools (list): List of tools available to this agent
         system_prompt (str): System prompt defining agent behavior
         
@@ -70,27 +112,91 @@ def create_agent(llm: ChatOpenAI, tools: list, system_prompt: str) -> AgentExecu
     return executor
 
 
-def agent_node(state: AgentState, agent: AgentExecutor, name: str) -> dict:
+def create_tool_chain(llm: ChatOpenAI, tool: BaseTool, system_prompt: str) -> Runnable:
+    """
+    Factory function for a worker whose prompt always calls one single tool.
+    
+    An AgentExecutor spends a full LLM turn deciding to call the tool before
+    writing its answer. Here the tool call is fixed: a tool without
+    arguments runs directly, and a tool with arguments is forced through
+    `tool_choice` so the model only fills them in. A final LLM call then
+    answers from the tool output.
+    
+    Args:
+        llm (ChatOpenAI): Language model instance
+        tool (BaseTool): The worker's only tool
+        system_prompt (str): System prompt defining agent behavior
+        
+    Returns:
+        Runnable: Chain returning {"output": ...} like an AgentExecutor
+    """
+    if tool.args:
+        # Force the call so the model only has to produce the arguments
+        call_prompt = ChatPromptTemplate.from_messages([
+            ("system", system_prompt),
+            MessagesPlaceholder(variable_name="messages"),
+        ])
+        call_tool = (
+            call_prompt
+            | llm.bind_tools([tool], tool_choice=tool.name)
+            | JsonOutputToolsParser(first_tool_only=True)
+            | (lambda tool_call: tool_call["args"])
+            | tool
+        )
+    else:
+        # Nothing for the model to decide: run the tool straight away
+        call_tool = RunnableLambda(lambda _: {}) | tool
+    
+    # Answer from the conversation plus the tool output
+    answer_prompt = ChatPromptTemplate.from_messages([
+        ("system", system_prompt),
+        MessagesPlaceholder(variable_name="messages"),
+        ("system", "Result of the {tool_name} tool:\n{tool_output}"),
+    ]).partial(tool_name=tool.name)
+    
+    return (
+        RunnablePassthrough.assign(tool_output=call_tool)
+        | answer_prompt
+        | llm
+        | StrOutputParser()
+        | (lambda output: {"output": output})
+    )
+
+
+async def agent_node(state: AgentState, agent: Runnable, name: str) -> dict:
     """
     Wrapper function that converts agent executors into graph nodes.
     
+    The node is a coroutine so that workers dispatched in parallel by the
+    supervisor overlap their LLM and tool round trips on one event loop.
+    
     This function:
-    1. Executes the agent with current state
+    1. Executes the agent with current state, bounded by AGENT_TIMEOUT_SECONDS
     2. Formats the output as a HumanMessage
     3. Returns updated state with agent's response
     
+    A timed-out agent reports a message asking the supervisor to reroute,
+    so the conversation continues instead of hanging.
+    
     Args:
         state (AgentState): Current graph state
-        agent (AgentExecutor): Agent to execute
+        agent (Runnable): Agent executor or tool chain to execute
         name (str): Agent name for message attribution
         
     Returns:
         dict: Updated state with agent's response message
     """
-    print(f"EXECUTING {name.upper()} AGENT WITH STATE:", state)
+    logger.debug("Executing %s agent with state: %s", name, state)
     
     # Execute agent and get result
-    result = agent.invoke(state)
+    try:
+        result = await asyncio.wait_for(agent.ainvoke(state), timeout=AGENT_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("%s agent timed out after %s seconds", name, AGENT_TIMEOUT_SECONDS)
+        result = {
+            "output": f"{name} agent timed out before completing its task. "
+                      "Supervisor, please reroute or finish."
+        }
     
     # Return formatted message with agent name attribution
     return {
@@ -100,16 +206,17 @@ def agent_node(state: AgentState, agent: AgentExecutor, name: str) -> dict:
 
 def debug_output(data):
     """Debug utility function for development/troubleshooting."""
-    print("DEBUG OUTPUT:", data)
+    logger.debug("Debug output: %s", data)
     return data
 
 
 def flatten_output(data: dict) -> dict:
     """
-    Flattens nested 'args' structure from Groq/Llama tool outputs.
+    Flattens nested 'args' structure from tool-call outputs.
     
-    This is needed because different LLM providers return tool calls
-    in slightly different formats. This normalizes the structure.
+    This is needed because tool calls come back as {"type": ..., "args": {...}}
+    while the graph expects the arguments at the top level. The input dict
+    is left untouched.
     
     Args:
         data (dict): Raw tool output with potential 'args' nesting
@@ -117,14 +224,149 @@ def flatten_output(data: dict) -> dict:
     Returns:
         dict: Flattened dictionary with args content at top level
     """
-    if 'args' in data and isinstance(data['args'], dict):
-        # Extract args content and merge with top level
-        args_content = data.pop('args')
-        data.update(args_content)
-    return data
+    args = data.get('args')
+    if not isinstance(args, dict):
+        return data
+    
+    # Merge args content with the remaining top-level keys
+    return {**{key: value for key, value in data.items() if key != 'args'}, **args}
 
 
-def define_graph(llm: ChatOpenAI, llm_name: str) -> StateGraph:
+class RouteOutputParser(JsonOutputToolsParser):
+    """
+    Parses the supervisor's route tool call into a flat decision dict.
+    
+    Flattening happens inside the parser, so the supervisor chain needs no
+    extra step after it.
+    """
+    
+    first_tool_only: bool = True
+    
+    def parse_result(self, result: list, *, partial: bool = False) -> Any:
+        tool_call = super().parse_result(result, partial=partial)
+        return flatten_output(tool_call) if isinstance(tool_call, dict) else tool_call
+
+
+def rule_route(state: AgentState) -> Optional[list]:
+    """
+    Routes a user query by keyword rules, without calling the LLM.
+    
+    Only the first decision after a user query is made by rule; decisions
+    after a worker has replied depend on its result and go to the LLM. A
+    letter request goes straight to the Generator only once both the
+    Analyzer and the Searcher have reported in this conversation, since the
+    letter tools need the CV and the job details.
+    
+    Args:
+        state (AgentState): Current graph state
+        
+    Returns:
+        Optional[list]: The single worker to run, or None when no rule
+            applies unambiguously
+    """
+    last_message = state["messages"][-1]
+    if last_message.name is not None:
+        return None
+    
+    query = last_message.content
+    if _LETTER_RULE.search(query):
+        reported = {message.name for message in state["messages"]}
+        return ["Generator"] if {"Analyzer", "Searcher"} <= reported else None
+    
+    matched = [worker for pattern, worker in _ROUTER_RULES if pattern.search(query)]
+    return matched if len(matched) == 1 else None
+
+
+def with_routing_rules(supervisor_chain: Runnable) -> Runnable:
+    """
+    Wraps the supervisor chain so that rule_route is tried first.
+    
+    Args:
+        supervisor_chain (Runnable): Chain producing {"next": [...]}
+        
+    Returns:
+        Runnable: Supervisor runnable that only invokes the chain when no
+            rule applies
+    """
+    async def route(state: AgentState) -> dict:
+        workers = rule_route(state)
+        if workers is not None:
+            logger.debug("Routed by rule to %s", workers)
+            return {"next": workers}
+        return await supervisor_chain.ainvoke(state)
+    
+    return RunnableLambda(route)
+
+
+def with_routing_cache(supervisor_chain: Runnable, cache: CacheManager) -> Runnable:
+    """
+    Wraps the supervisor chain with a semantic cache of routing decisions.
+    
+    Only the decision taken right after the first user query of a
+    conversation thread is cached, since only it depends on the query
+    alone. Later decisions depend on worker results, and once the thread
+    holds earlier turns (replayed by the checkpointer) so does the first
+    decision of every new query: work already done need not be repeated.
+    The cache is shared by all sessions, so such decisions always go to
+    the supervisor. Near-duplicate opening queries ("extract my CV") skip
+    the supervisor LLM call and go straight to the cached workers.
+    
+    Args:
+        supervisor_chain (Runnable): Chain producing {"next": [...]}
+        cache (CacheManager): Cache keyed on the user query embedding
+        
+    Returns:
+        Runnable: Supervisor runnable consulting the cache first
+    """
+    async def route(state: AgentState) -> dict:
+        last_message = state["messages"][-1]
+        
+        # Anything before the query (worker replies of this turn, or
+        # earlier turns of the thread) makes the decision context-dependent
+        if len(state["messages"]) > 1:
+            return await supervisor_chain.ainvoke(state)
+        
+        query = last_message.content
+        cached = await asyncio.to_thread(cache.get_cache, query)
+        if cached is not None:
+            return {"next": cached}
+        
+        decision = await supervisor_chain.ainvoke(state)
+        cache.put_cache_async(query, decision["next"])
+        return decision
+    
+    return RunnableLambda(route)
+
+
+def route_next(state: AgentState) -> list:
+    """
+    Resolves the supervisor's decision into the list of nodes to run next.
+    
+    Returning several worker names makes LangGraph execute them in the same
+    step, so independent agents (e.g. Analyzer and Searcher) run in parallel.
+    Their messages are merged by the `operator.add` reducer on the state.
+    
+    Args:
+        state (AgentState): Current graph state after the supervisor step
+        
+    Returns:
+        list: Worker names to execute, or ["FINISH"] when nothing is left
+    """
+    next_agents = state["next"]
+    
+    # Some providers still answer with a single string despite the schema
+    if isinstance(next_agents, str):
+        next_agents = [next_agents]
+    
+    workers = [agent for agent in dict.fromkeys(next_agents) if agent != "FINISH"]
+    return workers or ["FINISH"]
+
+
+def define_graph(
+    llm: ChatOpenAI, 
+    llm_name: str, 
+    route_cache: Optional[CacheManager] = None
+) -> StateGraph:
     """
     Main function that constructs the multi-agent workflow graph.
     
@@ -136,6 +378,8 @@ def define_graph(llm: ChatOpenAI, llm_name: str) -> StateGraph:
     Args:
         llm (ChatOpenAI): Language model instance
         llm_name (str): LLM provider name ('openai', 'groq', 'llama3')
+        route_cache (Optional[CacheManager]): Semantic cache for the
+            supervisor's routing decisions; disabled when None
         
     Returns:
         StateGraph: Compiled workflow graph ready for execution
@@ -145,27 +389,27 @@ def define_graph(llm: ChatOpenAI, llm_name: str) -> StateGraph:
     # AGENT CONFIGURATION
     # ==============================================
     
-    # Define available worker agents
-    members = ["Analyzer", "Generator", "Searcher"]
-    
-    # Define routing options (workers + finish command)
-    options = ["FINISH"] + members
+    # Define available worker agents and routing options
+    members = MEMBERS
+    options = OPTIONS
     
     # ==============================================
     # SUPERVISOR SETUP
     # ==============================================
     
-    # Define function schema for routing decisions
+    # Define function schema for routing decisions. The supervisor may pick
+    # several workers at once; independent ones are dispatched in parallel.
     function_def = {
         "name": "route",
-        "description": "Select the next role.",
+        "description": "Select the next role(s).",
         "parameters": {
             "title": "routeSchema",
             "type": "object",
             "properties": {
                 "next": {
                     "title": "Next",
-                    "anyOf": [{"enum": options}],
+                    "type": "array",
+                    "items": {"enum": options},
                 }
             },
             "required": ["next"],
@@ -173,52 +417,67 @@ def define_graph(llm: ChatOpenAI, llm_name: str) -> StateGraph:
     }
 
     # Get LLM-specific prompts
-    prompt = routing_prompt(llm_name, options, members)
+    prompt = routing_prompt(llm_name, OPTIONS, MEMBERS)
     
-    print(f"Configuring supervisor for LLM: {llm_name}")
+    logger.info("Configuring supervisor for LLM: %s", llm_name)
     
     # Create supervisor chain based on LLM provider
     if llm_name == "openai":
-        # OpenAI uses function calling
+        # OpenAI uses forced tool calling. The route already lists every
+        # worker to run next, so parallel calls are disabled: the parser
+        # reads a single route call, and extra ones would be dropped
         supervisor_chain = (
             prompt
-            | llm.bind_functions(functions=[function_def], function_call="route") 
-            | JsonOutputFunctionsParser()
+            | llm.bind_tools(tools=[function_def], tool_choice="route", parallel_tool_calls=False)
+            | RouteOutputParser()  # Flattens the route arguments
         )
     elif llm_name in ["groq", "llama3"]:
         # Groq/Llama use tool calling with different parsing
         supervisor_chain = (
             prompt
             | llm.bind_tools(tools=[function_def]) 
-            | JsonOutputToolsParser(first_tool_only=True)
-            | flatten_output  # Normalize output structure
+            | RouteOutputParser()  # Flattens the route arguments
         )
-        print("DEBUG: Supervisor chain configured for Groq/Llama")
+        logger.debug("Supervisor chain configured for Groq/Llama")
+
+    # Skip the supervisor LLM call for queries seen before
+    if route_cache is not None:
+        supervisor_chain = with_routing_cache(supervisor_chain, route_cache)
+    
+    # Clear single-intent queries are routed by rule before the cache is
+    # consulted, saving the embedding request as well
+    supervisor_chain = with_routing_rules(supervisor_chain)
 
     # ==============================================
     # WORKER AGENT SETUP
     # ==============================================
     
+    # Let tool-using agents emit several tool calls in one response; the
+    # async AgentExecutor runs them concurrently. Only OpenAI accepts the
+    # flag, and only on requests that carry tools.
+    tools_llm = llm.bind(parallel_tool_calls=True) if llm_name == "openai" else llm
+    
     # Create Searcher Agent - handles job search operations
     search_agent = create_agent(
-        llm=llm, 
+        llm=tools_llm, 
         tools=[job_pipeline],  # job_pipeline is a tool that searches for jobs
         system_prompt=get_search_agent_prompt(llm_name)
     )
     search_node = functools.partial(agent_node, agent=search_agent, name="Searcher")
 
-    # Create Analyzer Agent - handles CV analysis and job matching
-    analyzer_agent = create_agent(
+    # Create Analyzer Agent - handles CV analysis and job matching.
+    # extract_cv takes no arguments, so it runs without a planning LLM turn.
+    analyzer_agent = create_tool_chain(
         llm=llm, 
-        tools=[extract_cv], 
+        tool=extract_cv, 
         system_prompt=get_analyzer_agent_prompt(llm_name)
     )
     analyzer_node = functools.partial(agent_node, agent=analyzer_agent, name="Analyzer")
 
     # Create Generator Agent - handles cover letter generation
     generator_agent = create_agent(
-        llm=llm, 
-        tools=[generate_letter_for_specific_job], 
+        llm=tools_llm, 
+        tools=[generate_letter_for_specific_job, generate_letters_for_jobs], 
         system_prompt=get_generator_agent_prompt(llm_name)
     )
     generator_node = functools.partial(agent_node, agent=generator_agent, name="Generator")
@@ -250,15 +509,16 @@ def define_graph(llm: ChatOpenAI, llm_name: str) -> StateGraph:
     
     workflow.add_conditional_edges(
         "supervisor", 
-        lambda x: x["next"],  # Extract 'next' field from supervisor output
+        route_next,  # Fan out to every worker selected by the supervisor
         conditional_map
     )
     
     # Set supervisor as entry point
     workflow.set_entry_point("supervisor")
 
-    # Compile and return the executable graph
-    graph = workflow.compile()
+    # Compile and return the executable graph. The checkpointer keeps each
+    # conversation thread's state, so later turns build on earlier ones.
+    graph = workflow.compile(checkpointer=MemorySaver())
     return graph
 
 
@@ -282,4 +542,5 @@ State Management:
 - All agents share the same AgentState
 - Messages accumulate automatically (operator.add)
 - Supervisor maintains routing decisions in 'next' field
+- State is checkpointed per conversation thread ('thread_id' in config)
 """
\ No newline at end of file
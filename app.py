@@ -14,17 +14,29 @@ the LangGraph multi-agent system for processing user requests.
 
 import streamlit as st
 from dotenv import load_dotenv
+import asyncio
+import logging
 import os
+import queue
+import threading
+import uuid
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Configure logging; set LOGLEVEL=INFO or DEBUG for progress and full traces
+logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING"))
+logger = logging.getLogger(__name__)
+
 # Import core system components
-from agents import define_graph
+from agents import define_graph, WORKER_NAMES
 from streamlit_chat import message
-from llms import load_llm 
+from llms import load_llm, load_embeddings, warm_up
+from cache import CacheManager
+from data_loader import load_cv_bundle
+from tools import set_cv_bundle
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.messages import HumanMessage
-from langchain_community.callbacks import StreamlitCallbackHandler
 from streamlit_pills import pills
 
 
@@ -55,16 +67,93 @@ uploaded_file = st.sidebar.file_uploader(
 # SYSTEM INITIALIZATION
 # ==============================================
 
-# Initialize LLM and agent system
-llm_name = os.environ.get('LLM_NAME')
-llm = load_llm(llm_name)
-print(f"Initialized LLM: {llm}")
+@st.cache_resource
+def get_embeddings(llm_name: str):
+    """Load the embedding model once per process (None if unsupported)."""
+    return load_embeddings(llm_name)
+
+
+@st.cache_resource
+def get_graph(llm_name: str):
+    """
+    Build the LLM client and the compiled multi-agent graph once per process.
+    
+    Streamlit re-executes this script on every widget interaction, so without
+    caching each rerun would rebuild every agent and recompile the graph.
+    """
+    llm = load_llm(llm_name)
+    
+    # Open the provider connection now rather than on the first query
+    run_async(warm_up(llm_name))
+    
+    # Cache routing decisions when the provider offers embeddings
+    embeddings = get_embeddings(llm_name)
+    route_cache = CacheManager(embeddings) if embeddings is not None else None
+    
+    return llm, define_graph(llm, llm_name, route_cache=route_cache)
+
+
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop shared by every graph run in this process.
+    
+    The cached LLM clients keep pooled async HTTP connections that belong to
+    the loop which opened them, so all runs must reuse the same loop. It runs
+    forever on a background thread, so runs from different sessions
+    interleave on it instead of queueing behind each other.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="graph-event-loop", daemon=True).start()
+    return loop
+
+
+def run_async(coro):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+
+class CallbackRelay(BaseCallbackHandler):
+    """
+    Queues LangChain callback events for replay on the Streamlit script thread.
+    
+    Graph runs execute on the shared loop thread, but Streamlit elements can
+    only be written from the session's script thread. The relay records each
+    event as (method name, args, kwargs); the script thread replays them
+    into the session's StreamlitCallbackHandler in order.
+    """
+    
+    run_inline = True
+    
+    def __init__(self, events: queue.Queue):
+        self.events = events
+
+
+def _relay_event(name: str):
+    """Build a CallbackRelay method that queues the `name` event."""
+    def relay(self, *args, **kwargs):
+        self.events.put((name, args, kwargs))
+    return relay
+
+
+for _event_name in [name for name in dir(BaseCallbackHandler) if name.startswith("on_")]:
+    setattr(CallbackRelay, _event_name, _relay_event(_event_name))
+del _event_name
+
+
+@st.cache_resource
+def get_callback_handler_class():
+    """
+    Import the Streamlit callback handler on first use.
+    
+    langchain_community is a heavy import, so it is deferred until a CV has
+    been uploaded and the chat is actually shown.
+    """
+    from langchain_community.callbacks import StreamlitCallbackHandler
+    return StreamlitCallbackHandler
 
-# Create Streamlit callback handler for displaying agent interactions
-st_callback = StreamlitCallbackHandler(st.container())
 
-# Initialize the multi-agent graph
-graph = define_graph(llm, llm_name)
+llm_name = os.environ.get('LLM_NAME')
 
 
 # ==============================================
@@ -72,26 +161,77 @@ graph = define_graph(llm, llm_name)
 # ==============================================
 
 if uploaded_file is not None:
-    # Create temporary directory for file storage
-    temp_dir = "tmp"
-    if not os.path.exists(temp_dir):
-        os.makedirs(temp_dir)
-        print(f"Created temporary directory: {temp_dir}")
-
-    # Save uploaded file with standardized name
-    bytes_data = uploaded_file.getvalue()
-    predefined_name = "cv.pdf"
-    file_path = os.path.join(temp_dir, predefined_name)
-    
-    with open(file_path, "wb") as f:
-        f.write(bytes_data)
-    
-    print(f"CV uploaded successfully: {file_path}")
+    # Initialize LLM and agent system only once there is a CV to work with
+    llm, graph = get_graph(llm_name)
+
+    # Create Streamlit callback handler for displaying agent interactions.
+    # Tokens are drawn as they stream in; events raised on the loop thread
+    # are replayed into it from this script thread.
+    st_callback = get_callback_handler_class()(st.container())
+
+    # Reruns keep the processed CV; only a new upload is parsed
+    if st.session_state.get('cv_file_id') != uploaded_file.file_id:
+        # Parse and section the CV once per upload and keep it in the
+        # session; each run hands it to the tools in memory, so agent calls
+        # read it instead of re-parsing the PDF
+        cv_bundle = load_cv_bundle(uploaded_file.getvalue())
+        logger.info("CV uploaded successfully: %s", uploaded_file.name)
+        
+        st.session_state['cv_bundle'] = cv_bundle
+        st.session_state['cv_file_id'] = uploaded_file.file_id
 
     # ==============================================
     # CHAT FUNCTIONALITY
     # ==============================================
 
+    async def stream_graph(
+        query: str, graph, thread_id: str, cv_bundle, events: queue.Queue
+    ) -> None:
+        """
+        Run the agent graph on the shared loop, queueing everything to display.
+        
+        Each per-node state update is queued as ("update", (update,), {}) and
+        each callback event as (method name, args, kwargs); None marks the
+        end of the run. Nothing here touches Streamlit, since this runs on
+        the loop thread rather than the session's script thread.
+        
+        Parameters:
+        -----------
+        query : str
+            User's input query or question
+        graph : StateGraph
+            Compiled LangGraph workflow for agent execution
+        thread_id : str
+            Conversation thread of the session
+        cv_bundle : CVBundle
+            Processed CV of the session, read by the tools during this run
+        events : queue.Queue
+            Queue read by conversational_chat on the script thread
+        """
+        # Continue this session's conversation thread so the graph sees
+        # earlier turns instead of starting from scratch on every submit,
+        # and relay every agent's tokens to the page as they are generated
+        config = {
+            "recursion_limit": 100,
+            "configurable": {"thread_id": thread_id},
+            "callbacks": [CallbackRelay(events)],
+        }
+        
+        # The run executes in a context of its own, so the CV set here is the
+        # one this session's tools see, whatever other sessions are running
+        set_cv_bundle(cv_bundle)
+        
+        try:
+            # Stream per-node state updates with recursion limit
+            async for update in graph.astream(
+                {"messages": [HumanMessage(content=query)]},
+                config,
+                stream_mode="updates",
+            ):
+                events.put(("update", (update,), {}))
+        finally:
+            events.put(None)
+
     def conversational_chat(query: str, graph) -> str:
         """
         Main conversation handler that processes user queries through the agent system.
@@ -102,6 +242,9 @@ if uploaded_file is not None:
         3. Stores conversation history
         4. Returns the final combined response
         
+        The graph runs on the shared event loop while this script thread
+        draws its updates and replays its callback events as they arrive.
+        
         Parameters:
         -----------
         query : str
@@ -114,39 +257,51 @@ if uploaded_file is not None:
         str
             Combined response from all agents that participated in the conversation
         """
-        results = []
+        responses = []
+        
+        logger.debug("Processing query: %s", query)
         
-        print(f"Processing query: {query}")
+        events = queue.Queue()
+        run = asyncio.run_coroutine_threadsafe(
+            stream_graph(
+                query, graph, st.session_state['thread_id'],
+                st.session_state['cv_bundle'], events
+            ),
+            get_event_loop()
+        )
         
-        # Stream the graph execution with recursion limit
-        for s in graph.stream(
-            {"messages": [HumanMessage(content=query)]},
-            {"recursion_limit": 100},
-        ):
-            # Skip the final end state
-            if "__end__" not in s:
-                result = list(s.values())[0]
+        for name, args, kwargs in iter(events.get, None):
+            if name != "update":
+                getattr(st_callback, name)(*args, **kwargs)
+                continue
+            
+            # Workers dispatched in parallel report in the same step
+            for node_name, result in args[0].items():
                 
                 # Handle agent message outputs
-                if 'messages' in result:
-                    for message_data in result['messages']:
-                        agent_name = message_data.name or 'System'
-                        message_content = message_data.content
+                if node_name in WORKER_NAMES:
+                    for agent_message in result['messages']:
+                        agent_name = agent_message.name or 'System'
+                        content = agent_message.content
                         
                         # Store result for history
-                        agent_response = f"{agent_name} Agent: {message_content}"
-                        results.append(agent_response)
+                        responses.append((agent_name, content))
                         
                         # Display in Streamlit interface
                         st.header(f"{agent_name} Agent:")
-                        st.write(message_content)
+                        st.write(content)
                         
                 # Handle routing decisions
-                elif 'next' in result:
+                elif node_name == "supervisor":
                     st.write(f"Supervisor Decision: {result}")
-                    print(f"Routing to: {result}")
+                    logger.debug("Routing to: %s", result)
+        
+        # Re-raise any error from the run
+        run.result()
 
         # Store conversation in session state
+        # Format the attributed responses once the run is over
+        results = [f"{agent_name} Agent: {content}" for agent_name, content in responses]
         st.session_state['history'].append((query, results))
         
         return ' '.join(results)
@@ -162,6 +317,9 @@ if uploaded_file is not None:
     if 'history' not in st.session_state:
         st.session_state['history'] = []
         
+    if 'thread_id' not in st.session_state:
+        st.session_state['thread_id'] = uuid.uuid4().hex
+        
     if 'generated' not in st.session_state:
         st.session_state['generated'] = ["Hello! Ask anything to your Job agent: 🤗"]
         
@@ -217,7 +375,7 @@ if uploaded_file is not None:
 
         # Process user input when form is submitted
         if submit_button and user_input:
-            print(f"User submitted: {user_input}")
+            logger.debug("User submitted: %s", user_input)
             
             # Process query through agent system
             output = conversational_chat(user_input, graph)
@@ -0,0 +1,292 @@
+"""
+Cache Module
+
+This module provides the caches used to avoid repeated LLM round trips:
+
+- CacheManager: a similarity-based cache for supervisor routing decisions.
+  Queries are embedded and compared by cosine similarity, so repeated or
+  near-duplicate requests reuse an earlier decision.
+- ResponseCache: an exact-match cache of chat model responses, plugged into
+  LangChain's `cache=` hook on deterministic models. LangChain consults the
+  hook on invoke and batch but not on `astream`, so streaming callers must
+  check it themselves (see tools._stream_text).
+
+Dependencies:
+    - numpy: For the in-memory embedding matrix and similarity search
+    - cachetools: For the in-memory TTL response cache
+    - redis (optional): For a shared response cache across processes
+
+Environment Variables:
+    - LLM_CACHE_BACKEND: 'memory' (default) or 'redis'
+    - REDIS_URL: Redis connection URL for the redis backend
+"""
+
+import hashlib
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+import numpy as np
+from cachetools import TTLCache
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.embeddings import Embeddings
+
+
+# Response cache defaults: entries expire after an hour
+RESPONSE_CACHE_MAX_ENTRIES = 10_000
+RESPONSE_CACHE_TTL_SECONDS = 3600
+
+_response_cache: Optional[BaseCache] = None
+
+# Background writers shared by every CacheManager, so creating many caches
+# (one per CV and job for cover letters) never adds threads
+CACHE_WRITER_THREADS = 2
+_writer = ThreadPoolExecutor(max_workers=CACHE_WRITER_THREADS, thread_name_prefix="cache-writer")
+
+# Embeddings are unit length, so every component lies in [-1, 1] and a
+# single fixed scale maps them onto int8 without per-vector calibration
+INT8_SCALE = 127
+
+
+class CacheManager:
+    """
+    In-memory semantic cache mapping query embeddings to decisions.
+
+    Embeddings are L2-normalized and stacked into a single matrix, so a
+    lookup is one matrix-vector product followed by an argmax. Writes can be
+    deferred to background threads shared by all caches, so they never
+    delay the caller.
+
+    With `quantize`, the matrix is stored as int8 instead of float32, a
+    quarter of the memory, at a similarity error around 1e-3. numpy has no
+    int8 matrix kernels, so lookups are not faster; use it for caches that
+    hold many entries rather than ones on a latency-critical path.
+
+    Args:
+        embeddings (Embeddings): LangChain embedding model used for queries
+        max_entries (int): Maximum number of cached entries; the oldest
+            entries are evicted first
+        quantize (bool): Store cached embeddings as int8
+
+    Example:
+        >>> cache = CacheManager(OpenAIEmbeddings())
+        >>> cache.put_cache("extract my CV", ["Analyzer"])
+        >>> cache.get_cache("please extract my cv")
+        ['Analyzer']
+    """
+
+    def __init__(self, embeddings: Embeddings, max_entries: int = 256, quantize: bool = False):
+        self.embeddings = embeddings
+        self.max_entries = max_entries
+        self.quantize = quantize
+
+        self._vectors: Optional[np.ndarray] = None
+        self._decisions: list = []
+        self._last_query: Optional[tuple] = None
+        self._lock = threading.Lock()
+
+    def _embed(self, query: str) -> np.ndarray:
+        """Embed and normalize a query, reusing the last lookup's embedding."""
+        last_query = self._last_query
+        if last_query is not None and last_query[0] == query:
+            return last_query[1]
+
+        vector = np.asarray(self.embeddings.embed_query(query), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm:
+            vector /= norm
+
+        self._last_query = (query, vector)
+        return vector
+
+    def get_cache(self, query: str, threshold: float = 0.85) -> Optional[Any]:
+        """
+        Look up the decision stored for the most similar cached query.
+
+        Args:
+            query (str): Query text to look up
+            threshold (float): Minimum cosine similarity for a hit
+
+        Returns:
+            Optional[Any]: Cached decision, or None on a miss
+        """
+        with self._lock:
+            vectors, decisions = self._vectors, self._decisions
+
+        # Nothing cached yet: skip the embedding call entirely
+        if vectors is None:
+            return None
+
+        query_vector = self._embed(query)
+        if self.quantize:
+            scores = (vectors @ query_vector) / INT8_SCALE
+        else:
+            scores = vectors @ query_vector
+        best = int(np.argmax(scores))
+
+        if scores[best] >= threshold:
+            return decisions[best]
+        return None
+
+    def put_cache(self, query: str, decision: Any) -> None:
+        """
+        Store a decision for a query.
+
+        Args:
+            query (str): Query text the decision was made for
+            decision (Any): Decision to return for similar queries
+        """
+        vector = self._embed(query)
+        if self.quantize:
+            vector = quantize_int8(vector)
+
+        with self._lock:
+            if self._vectors is None:
+                vectors = vector[np.newaxis, :]
+            else:
+                vectors = np.vstack([self._vectors, vector])
+
+            # Rebind rather than mutate so concurrent readers keep a
+            # consistent snapshot of vectors and decisions
+            self._vectors = vectors[-self.max_entries:]
+            self._decisions = (self._decisions + [decision])[-self.max_entries:]
+
+    def put_cache_async(self, query: str, decision: Any) -> Future:
+        """
+        Store a decision on a background thread.
+
+        Args:
+            query (str): Query text the decision was made for
+            decision (Any): Decision to return for similar queries
+
+        Returns:
+            Future: Completes once the entry has been written
+        """
+        return _writer.submit(self.put_cache, query, decision)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._vectors = None
+            self._decisions = []
+
+
+def quantize_int8(vectors: np.ndarray) -> np.ndarray:
+    """
+    Quantize L2-normalized embeddings to int8.
+
+    Args:
+        vectors (np.ndarray): Unit-length embeddings, one per row (or a
+            single vector)
+
+    Returns:
+        np.ndarray: int8 array of the same shape; divide dot products with
+            float vectors by INT8_SCALE to recover cosine similarities
+    """
+    return np.clip(np.round(vectors * INT8_SCALE), -INT8_SCALE, INT8_SCALE).astype(np.int8)
+
+
+class ResponseCache(BaseCache):
+    """
+    In-memory TTL cache of chat model responses keyed by prompt and config.
+    
+    LangChain passes the serialized messages and a string describing the
+    model configuration (model name, temperature, bound tools, ...), which
+    are hashed with SHA-256 into a fixed-size key. Only attach this cache to
+    deterministic models, since a hit replays the earlier answer verbatim.
+    
+    Args:
+        max_entries (int): Maximum number of cached responses
+        ttl (int): Seconds before a cached response expires
+        
+    Example:
+        >>> llm = ChatOpenAI(temperature=0, cache=ResponseCache())
+        >>> llm.cache.stats
+        {'hits': 0, 'misses': 0, 'entries': 0}
+    """
+    
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+                 ttl: int = RESPONSE_CACHE_TTL_SECONDS):
+        self._cache = TTLCache(maxsize=max_entries, ttl=ttl)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        """Hash a prompt and model configuration into a cache key."""
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode()).hexdigest()
+    
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return the cached generations for a prompt, or None on a miss."""
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+    
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store the generations produced for a prompt."""
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            self._cache[key] = return_val
+    
+    def clear(self, **kwargs: Any) -> None:
+        """Remove every cached response and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+    
+    # Lookups are in-memory, so the async variants skip the executor hop
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self.lookup(prompt, llm_string)
+    
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        self.update(prompt, llm_string, return_val)
+    
+    @property
+    def stats(self) -> dict:
+        """Hit and miss counts and the current number of entries."""
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses, 'entries': len(self._cache)}
+
+
+def get_response_cache() -> BaseCache:
+    """
+    Get the process-wide chat response cache.
+    
+    The backend is chosen by LLM_CACHE_BACKEND. With 'redis' the responses
+    are shared across processes through LangChain's RedisCache, which needs
+    the optional redis package; otherwise an in-memory ResponseCache is used.
+    
+    Returns:
+        BaseCache: Response cache for a chat model's `cache` field
+        
+    Raises:
+        ValueError: If LLM_CACHE_BACKEND names an unknown backend
+    """
+    global _response_cache
+    
+    if _response_cache is not None:
+        return _response_cache
+    
+    backend = os.environ.get("LLM_CACHE_BACKEND", "memory").lower()
+    
+    if backend == "memory":
+        _response_cache = ResponseCache()
+    elif backend == "redis":
+        import redis
+        from langchain_community.cache import RedisCache
+        
+        client = redis.Redis.from_url(os.environ.get("REDIS_URL", "redis://localhost:6379/0"))
+        _response_cache = RedisCache(client, ttl=RESPONSE_CACHE_TTL_SECONDS)
+    else:
+        raise ValueError(
+            f"Unsupported LLM_CACHE_BACKEND: {backend}. Supported options: ['memory', 'redis']"
+        )
+    
+    return _response_cache
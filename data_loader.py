@@ -6,57 +6,562 @@ Word documents. It handles PDF extraction and DOCX generation for the
 AI Job Assistance application.
 
 Dependencies:
-    - langchain_community.document_loaders: For PDF processing
+    - pymupdf: For PDF text extraction (MuPDF bindings)
+    - pypdfium2 (optional, not in requirements.txt): Alternative PDF text
+      extraction (PDFium bindings), needed only for CV_PDF_BACKEND=pypdfium2
     - python-docx: For Word document generation
+
+Environment Variables:
+    - CV_PDF_BACKEND: 'pymupdf' (default) or 'pypdfium2'
 """
 
-from langchain_community.document_loaders import PyPDFLoader
+import hashlib
+import json
+import importlib.util
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import pymupdf
 from docx import Document
 
 
+logger = logging.getLogger(__name__)
+
+# MuPDF prints recoverable parse errors of malformed PDFs straight to
+# stderr; failures still raise, and are logged by the loaders below
+pymupdf.TOOLS.mupdf_display_errors(False)
+
+# Neither MuPDF nor PDFium is thread-safe, and CVs are parsed on whichever
+# thread asks for them (Streamlit sessions, asyncio.to_thread workers), so
+# every use of either library holds this lock
+_pdf_lock = threading.Lock()
+
+# A PDF given either as a file path or as its raw bytes
+PdfSource = Union[str, bytes]
+
+# Blank line(s) separating paragraphs in plain text
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+# Extracted CV texts persisted across restarts, named by content hash.
+# Bump the version whenever extraction output changes to orphan old entries
+CV_CACHE_DIR = os.path.join("tmp", "cv_cache")
+CV_CACHE_VERSION = 5
+
+# PDF parsers that can extract CV text, selected by CV_PDF_BACKEND.
+# pypdfium2 is an optional, permissively licensed alternative to PyMuPDF
+CV_PDF_BACKENDS = ("pymupdf", "pypdfium2")
+
+# Page furniture removed from extracted CV text: page numbers, and running
+# headers/footers, i.e. lines repeated at the top or bottom of most pages
+_PAGE_NUMBER = re.compile(r'^\s*(?:page\s+)?\d{1,3}(?:\s*(?:of|/)\s*\d{1,3})?\s*$', re.IGNORECASE)
+_FURNITURE_EDGE_LINES = 2
+_HORIZONTAL_SPACE = re.compile(r'[ \t\u00a0]+')
+_BULLET = re.compile(r'^[•●▪■◦‣∙·*]\s*')
+_PAGE_COUNTER = re.compile(r'\s*\b(?:page\s+)?\d{1,3}(?:\s*(?:of|/)\s*\d{1,3})?$', re.IGNORECASE)
+
+# Block type reported by PyMuPDF for text (as opposed to image) blocks
+_TEXT_BLOCK = 0
+
+# Bounds on the work spent on one CV. Real CVs fit well within them; larger
+# or pathological PDFs are cut short with a warning instead of stalling the
+# parser and overflowing the LLM context downstream (~5k tokens of text)
+MAX_CV_PAGES = 10
+MAX_CV_CHARS = 20_000
+CV_PARSE_BUDGET_SECONDS = 5.0
+
+# Extracted CV texts and their metadata held in memory, keyed on (content
+# digest, backend); the oldest entry is dropped once CV_TEXT_CACHE_SIZE are held
+CV_TEXT_CACHE_SIZE = 8
+_cv_texts: Dict[tuple, Tuple[str, dict]] = {}
+_cv_text_lock = threading.Lock()
+
+# CV section headings, matched as whole lines. Headings that do not map to a
+# known section start an 'other' section so their content is not misfiled
+_SECTION_HEADINGS = {
+    'experience': r'(?:work |professional |relevant )?experience|employment(?: history)?|'
+                  r'work history|career history',
+    'skills': r'(?:technical |key |core )?skills|(?:core )?competencies|expertise',
+    'education': r'education|academic background|qualifications|certifications?',
+    'other': r'projects|achievements|awards|publications|languages|interests|'
+             r'summary|profile|about me|references|volunteering',
+}
+_SECTION_HEADING = re.compile(
+    r'^[ \t]*(?:' + '|'.join(
+        f'(?P<{section}>{pattern})' for section, pattern in _SECTION_HEADINGS.items()
+    ) + r')[ \t]*:?[ \t]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def _pdf_backend() -> str:
+    """
+    Get the PDF parser selected by CV_PDF_BACKEND.
+    
+    Read on every load, so parsers can be compared without a restart.
+    
+    Raises:
+        ValueError: If CV_PDF_BACKEND names an unknown parser
+        ImportError: If the selected parser's package is not installed
+    """
+    backend = os.environ.get("CV_PDF_BACKEND", "pymupdf").lower()
+    if backend not in CV_PDF_BACKENDS:
+        raise ValueError(
+            f"Unsupported CV_PDF_BACKEND: {backend}. Supported options: {list(CV_PDF_BACKENDS)}"
+        )
+    # pypdfium2 is optional; fail here rather than return an empty CV
+    if backend == "pypdfium2" and importlib.util.find_spec("pypdfium2") is None:
+        raise ImportError(
+            "CV_PDF_BACKEND=pypdfium2 requires the pypdfium2 package: pip install pypdfium2"
+        )
+    return backend
+
+
+def _open_pdf(source: PdfSource) -> pymupdf.Document:
+    """Open a PDF from a file path or from in-memory bytes."""
+    if isinstance(source, str):
+        return pymupdf.open(source)
+    return pymupdf.open(stream=source, filetype="pdf")
+
+
+def _extract_pages(source: PdfSource, backend: str = "pymupdf") -> Tuple[tuple, bool]:
+    """
+    Extract the text of the pages of a PDF.
+    
+    Only the first MAX_CV_PAGES pages are read, and extraction stops early
+    once CV_PARSE_BUDGET_SECONDS have passed; both cases log a warning.
+    The page cap always gives the same result, so only the time budget
+    makes an extraction incomplete.
+    
+    Args:
+        source (PdfSource): Path to the PDF file, or its raw bytes
+        backend (str): PDF parser to extract with, one of CV_PDF_BACKENDS
+        
+    Returns:
+        tuple: (pages, complete) where pages holds the text of each page
+            read, in order, and complete is False if the time budget ran
+            out before every page was read
+    """
+    with _pdf_lock:
+        if backend == "pypdfium2":
+            return _extract_pages_pdfium(source)
+        
+        with _open_pdf(source) as doc:
+            page_count = _capped_page_count(doc.page_count)
+            return _extract_pages_timed(lambda index: _page_text(doc[index]), page_count)
+
+
+def _extract_pages_pdfium(source: PdfSource) -> tuple:
+    """
+    Extract the text of the pages of a PDF with PDFium.
+    
+    Each page's text is read in one range-based call. PDFium keeps the
+    content-stream order of the text, and its CRLF line breaks are
+    normalized so the output looks like the PyMuPDF backend's.
+    
+    Args:
+        source (PdfSource): Path to the PDF file, or its raw bytes
+        
+    Returns:
+        tuple: (pages, complete), as returned by _extract_pages
+    """
+    import pypdfium2 as pdfium
+    
+    def extract_page(index: int) -> str:
+        text = pdf[index].get_textpage().get_text_range()
+        text = text.replace('\r\n', '\n').strip()
+        return f"{text}\n" if text else ""
+    
+    pdf = pdfium.PdfDocument(source)
+    try:
+        return _extract_pages_timed(extract_page, _capped_page_count(len(pdf)))
+    finally:
+        pdf.close()
+
+
+def _capped_page_count(page_count: int) -> int:
+    """Limit a document's page count to MAX_CV_PAGES, warning if it is cut."""
+    if page_count > MAX_CV_PAGES:
+        logger.warning("CV has %d pages; only the first %d are read", page_count, MAX_CV_PAGES)
+    return min(page_count, MAX_CV_PAGES)
+
+
+def _extract_pages_timed(extract_page: Callable[[int], str], page_count: int) -> Tuple[tuple, bool]:
+    """
+    Extract pages one by one until done or out of time.
+    
+    Args:
+        extract_page (Callable[[int], str]): Returns the text of a page index
+        page_count (int): Number of pages to extract
+        
+    Returns:
+        tuple: (pages, complete) where pages holds the text of the pages
+            extracted within CV_PARSE_BUDGET_SECONDS, and complete is False
+            if the budget ran out first
+    """
+    deadline = time.monotonic() + CV_PARSE_BUDGET_SECONDS
+    pages = []
+    for index in range(page_count):
+        if time.monotonic() > deadline:
+            logger.warning(
+                "CV parsing exceeded %.0fs; stopped after %d of %d pages",
+                CV_PARSE_BUDGET_SECONDS, index, page_count
+            )
+            return tuple(pages), False
+        pages.append(extract_page(index))
+    return tuple(pages), True
+
+
+def _page_text(page: pymupdf.Page) -> str:
+    """
+    Extract the text of a single PDF page in reading order.
+    
+    The page is read as text blocks sorted top-to-bottom, then
+    left-to-right, rather than in the PDF's content-stream order, which
+    scrambles multi-column and sidebar CV layouts. Vertical positions are
+    bucketed to 10pt so blocks on the same visual row sort by x.
+    
+    Args:
+        page (pymupdf.Page): Page to extract
+        
+    Returns:
+        str: Text content of the page, one block per line group
+    """
+    blocks = [
+        block for block in page.get_text("blocks")
+        if block[6] == _TEXT_BLOCK and block[4].strip()
+    ]
+    if not blocks:
+        return ""
+    
+    blocks.sort(key=lambda block: (round(block[1] / 10), block[0]))
+    return "\n".join(block[4].strip() for block in blocks) + "\n"
+
+
+def _clean_pages(pages: Sequence[str]) -> str:
+    """
+    Join extracted pages into compact CV text.
+    
+    Drops page numbers ("3", "Page 2 of 3") and repeats of running
+    headers/footers: lines found among the first or last few lines of more
+    than half of the pages (ignoring a trailing page counter, so "Jane Doe
+    - 2" matches across pages). The first occurrence is kept, as it often
+    names the candidate. Runs of spaces are collapsed, bullet glyphs become
+    "-", and blank lines are removed. The line structure is kept, since
+    segment_cv relies on headings being on lines of their own.
+    
+    Args:
+        pages (Sequence[str]): Text of each page, in order
+        
+    Returns:
+        str: Cleaned text, one line per text line
+    """
+    page_lines = [
+        [_HORIZONTAL_SPACE.sub(' ', line).strip() for line in page.splitlines()]
+        for page in pages
+    ]
+    page_lines = [[line for line in lines if line] for lines in page_lines]
+    
+    def edge_lines(lines: List[str]) -> set:
+        return set(lines[:_FURNITURE_EDGE_LINES] + lines[-_FURNITURE_EDGE_LINES:])
+    
+    # Count each edge line once per page, keyed without its page counter
+    repeated = set()
+    if len(page_lines) > 1:
+        counts = Counter(
+            key for lines in page_lines
+            for key in {_PAGE_COUNTER.sub('', line) for line in edge_lines(lines)}
+        )
+        repeated = {key for key, count in counts.items() if count > len(page_lines) / 2}
+    
+    kept = []
+    seen_furniture = set()
+    for lines in page_lines:
+        edges = edge_lines(lines)
+        for line in lines:
+            if _PAGE_NUMBER.match(line):
+                continue
+            key = _PAGE_COUNTER.sub('', line)
+            if line in edges and key in repeated:
+                if key in seen_furniture:
+                    continue
+                seen_furniture.add(key)
+            kept.append(_BULLET.sub('- ', line))
+    
+    return '\n'.join(kept) + '\n' if kept else ''
+
+
+def _content_digest(data: bytes) -> str:
+    """Hash PDF bytes into the key used by the CV text caches."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _cached_cv(digest: str, backend: str, data: bytes) -> Tuple[str, dict]:
+    """
+    Get the text and metadata of a CV by content hash, parsing only on a miss.
+    
+    Lookups go through the in-process cache first, then the on-disk cache
+    in CV_CACHE_DIR, and only then parse the PDF. Both caches are keyed on
+    the digest and backend alone, so the PDF bytes are neither hashed again
+    nor kept alive by the cache. Text cut short by the parse time budget is
+    returned but cached nowhere, so a later load can read the whole CV.
+    
+    Args:
+        digest (str): BLAKE2b hash of the PDF bytes
+        backend (str): PDF parser to extract with; each parser's output is
+            cached separately
+        data (bytes): Raw bytes of the PDF, parsed if the text is not cached
+        
+    Returns:
+        tuple: (text, metadata) where text is the cleaned text of the CV and
+            metadata matches get_document_metadata
+    """
+    key = (digest, backend)
+    with _cv_text_lock:
+        if key in _cv_texts:
+            text, metadata = _cv_texts[key]
+            return text, dict(metadata)
+    
+    text, metadata = _disk_cached_cv(digest, backend, data)
+    if not metadata['complete']:
+        return text, metadata
+    
+    with _cv_text_lock:
+        if len(_cv_texts) >= CV_TEXT_CACHE_SIZE:
+            _cv_texts.pop(next(iter(_cv_texts)))
+        _cv_texts[key] = (text, dict(metadata))
+    return text, metadata
+
+
+def _disk_cached_cv(digest: str, backend: str, data: bytes) -> Tuple[str, dict]:
+    """
+    Get the text and metadata of a CV from CV_CACHE_DIR, parsing and storing
+    them on a miss.
+    
+    Returns:
+        tuple: (text, metadata), as returned by _cached_cv. If parsing ran
+            out of time, metadata['complete'] is False and nothing was
+            written to disk
+    """
+    cache_path = os.path.join(
+        CV_CACHE_DIR, f"{digest}-{backend}-v{CV_CACHE_VERSION}.json"
+    )
+    
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            entry = json.load(f)
+        return entry.pop('text'), entry
+    except FileNotFoundError:
+        pass
+    
+    pages, complete = _extract_pages(data, backend)
+    text = _clean_pages(pages)
+    
+    if len(text) > MAX_CV_CHARS:
+        logger.warning("CV text truncated from %d to %d characters", len(text), MAX_CV_CHARS)
+        text = text[:MAX_CV_CHARS]
+    
+    metadata = {
+        'total_pages': len(pages),
+        'first_page_chars': len(pages[0]) if pages else 0,
+        'total_characters': len(text),
+        'complete': complete
+    }
+    
+    # A parse cut short by the time budget depends on load, not on the PDF;
+    # persisting it would blank (part of) this CV for good
+    if not complete:
+        return text, metadata
+    
+    # Write to a temporary name first so readers never see a partial file
+    os.makedirs(CV_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'text': text, **metadata}, f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+    
+    return text, metadata
+
+
 def load_cv(file_path: str) -> str:
     """
     Load and extract text content from a PDF CV/resume file.
     
-    This function uses LangChain's PyPDFLoader to read a PDF file and
-    concatenate all pages into a single text string for processing.
+    This function uses PyMuPDF to read a PDF file and concatenate all pages
+    into a single text string for processing. MuPDF's native parser is an
+    order of magnitude faster than pure-Python PDF readers, and the result
+    is cached by a hash of the file's content, in memory and on disk, so the
+    same CV is only parsed once even across uploads and restarts.
     
     Args:
         file_path (str): Path to the PDF file to be loaded
         
     Returns:
-        str: Concatenated text content from all pages of the PDF
+        str: Concatenated text content from all pages of the PDF, or "" if
+            the file cannot be read or parsed
+        
+    Raises:
+        ValueError, ImportError: If CV_PDF_BACKEND is misconfigured
         
     Example:
         >>> cv_text = load_cv("tmp/cv.pdf")
         >>> print(len(cv_text))
         1234
     """
+    # A configuration error is not a bad file: let it surface
+    backend = _pdf_backend()
+    
     try:
-        # Initialize PDF loader with the specified file path
-        loader = PyPDFLoader(file_path)
+        with open(file_path, 'rb') as f:
+            data = f.read()
         
-        # Load all pages from the PDF
-        pages = loader.load()
+        # Repeat calls on the same content skip PDF parsing entirely
+        text, _ = _cached_cv(_content_digest(data), backend, data)
+        return text
         
-        # Concatenate content from all pages
-        page_content = ''
-        for i in range(len(pages)):
-            page_content += pages[i].page_content
-            
-        return page_content
+    except Exception as e:
+        logger.error("Error loading CV from %s: %s", file_path, e)
+        return ""
+
+
+def load_cv_bytes(data: bytes) -> str:
+    """
+    Extract text content from a PDF CV held in memory.
+    
+    Works like load_cv, including the content-hash caches, but parses the
+    uploaded bytes directly instead of going through a file on disk.
+    
+    Args:
+        data (bytes): Raw bytes of the PDF file
+        
+    Returns:
+        str: Concatenated text content from all pages of the PDF, or "" if
+            the bytes cannot be parsed
+        
+    Raises:
+        ValueError, ImportError: If CV_PDF_BACKEND is misconfigured
+    """
+    # A configuration error is not a bad file: let it surface
+    backend = _pdf_backend()
+    
+    try:
+        text, _ = _cached_cv(_content_digest(data), backend, data)
+        return text
         
     except Exception as e:
-        print(f"Error loading CV from {file_path}: {str(e)}")
+        logger.error("Error loading CV from uploaded bytes: %s", e)
         return ""
 
 
+@dataclass
+class CVBundle:
+    """
+    Everything derived from an uploaded CV, computed once per upload.
+    
+    Parsing and sectioning happen when the CV is uploaded; the tools then
+    read the fields instead of redoing that work on each agent call.
+    
+    Attributes:
+        raw_bytes (bytes): The uploaded PDF
+        text (str): Extracted text, as returned by load_cv_bytes
+        sections (Dict[str, str]): The text split by segment_cv
+    """
+    raw_bytes: bytes
+    text: str
+    sections: Dict[str, str] = field(default_factory=dict)
+
+
+def load_cv_bundle(data: bytes) -> CVBundle:
+    """
+    Parse and section an uploaded CV in one pass.
+    
+    Args:
+        data (bytes): Raw bytes of the PDF file
+        
+    Returns:
+        CVBundle: The CV and everything derived from it. An unreadable PDF
+            gives a bundle with empty text
+        
+    Example:
+        >>> bundle = load_cv_bundle(uploaded_file.getvalue())
+        >>> list(bundle.sections)
+        ['experience', 'skills', 'education', 'other']
+    """
+    text = load_cv_bytes(data)
+    if not text:
+        return CVBundle(raw_bytes=data, text=text)
+    
+    return CVBundle(raw_bytes=data, text=text, sections=segment_cv(text))
+
+
+def segment_cv(text: str) -> Dict[str, str]:
+    """
+    Split CV text into sections by their headings.
+    
+    Lines consisting only of a known heading (e.g. "Work Experience",
+    "SKILLS", "Education:") start a new section. Text before the first
+    heading, usually the name, contact details and profile, is returned as
+    'other' together with any sections that are not experience, skills or
+    education.
+    
+    Args:
+        text (str): CV text as returned by load_cv
+        
+    Returns:
+        Dict[str, str]: Non-empty sections keyed by 'experience', 'skills',
+            'education' and 'other', in that order
+        
+    Example:
+        >>> segment_cv("Jane Doe\\nSkills\\nPython\\nEducation\\nBSc")
+        {'skills': 'Python', 'education': 'BSc', 'other': 'Jane Doe'}
+    """
+    parts = {section: [] for section in _SECTION_HEADINGS}
+    
+    section, start = 'other', 0
+    for match in _SECTION_HEADING.finditer(text):
+        parts[section].append(text[start:match.start()])
+        section, start = match.lastgroup, match.end()
+    parts[section].append(text[start:])
+    
+    sections = {}
+    for section, chunks in parts.items():
+        content = '\n'.join(chunk.strip() for chunk in chunks if chunk.strip())
+        if content:
+            sections[section] = content
+    return sections
+
+
+def load_cv_with_metadata(file_path: str) -> tuple:
+    """
+    Load the text content and metadata of a PDF CV from a single parse.
+    
+    The parse is cached by content like load_cv's, and the text is the
+    same load_cv returns for the file.
+    
+    Args:
+        file_path (str): Path to the PDF file to be loaded
+        
+    Returns:
+        tuple: (text, metadata) where metadata matches get_document_metadata
+    """
+    backend = _pdf_backend()
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    return _cached_cv(_content_digest(data), backend, data)
+
+
 def write_to_docx(text: str, filename: str = 'tmp/cover_letter.docx') -> str:
     """
     Write text content to a Word document (.docx) file.
     
-    This function takes plain text and creates a formatted Word document,
-    splitting the text by newlines and creating separate paragraphs.
+    This function takes plain text and creates a formatted Word document.
+    Blank lines separate paragraphs; single newlines inside a paragraph
+    become line breaks, so each paragraph is one XML element.
     
     Args:
         text (str): The text content to write to the document
@@ -72,29 +577,36 @@ def write_to_docx(text: str, filename: str = 'tmp/cover_letter.docx') -> str:
         tmp/cover_letter.docx
     """
     try:
-        print("Creating Word document...")
-        print(f"Text content length: {len(text)} characters")
+        logger.debug("Creating Word document from %d characters", len(text))
         
         # Create a new Word document
         doc = Document()
         
-        # Split text into paragraphs by newlines
-        paragraphs = text.split('\n')
+        # Split text into paragraphs on blank lines
+        paragraphs = _PARAGRAPH_BREAK.split(text)
         
         # Add each paragraph to the document
         for paragraph_text in paragraphs:
+            lines = [line for line in paragraph_text.split('\n') if line.strip()]
+            
             # Skip empty paragraphs to avoid unnecessary whitespace
-            if paragraph_text.strip():
-                doc.add_paragraph(paragraph_text)
+            if not lines:
+                continue
+            
+            # Keep single newlines as soft line breaks within the paragraph
+            paragraph = doc.add_paragraph()
+            for line in lines[:-1]:
+                paragraph.add_run(line).add_break()
+            paragraph.add_run(lines[-1])
         
         # Save the document to the specified file path
         doc.save(filename)
         
-        print(f"Document successfully saved as {filename}")
+        logger.debug("Document saved as %s", filename)
         return filename
         
     except Exception as e:
-        print(f"Error creating Word document: {str(e)}")
+        logger.error("Error creating Word document: %s", e)
         return ""
 
 
@@ -110,8 +622,6 @@ def validate_pdf_file(file_path: str) -> bool:
     Returns:
         bool: True if file exists and is a PDF, False otherwise
     """
-    import os
-    
     if not os.path.exists(file_path):
         return False
     
@@ -129,21 +639,50 @@ def get_document_metadata(file_path: str) -> dict:
         file_path (str): Path to the PDF file
         
     Returns:
-        dict: Dictionary containing document metadata
+        dict: Dictionary containing document metadata: total_pages and
+            first_page_chars of the pages read, total_characters of the
+            cleaned CV text, and complete (False if parsing ran out of time)
     """
     try:
-        loader = PyPDFLoader(file_path)
-        pages = loader.load()
+        # Shares the cached parse with load_cv
+        _, metadata = load_cv_with_metadata(file_path)
+        return metadata
         
-        if pages:
-            return {
-                'total_pages': len(pages),
-                'first_page_chars': len(pages[0].page_content),
-                'total_characters': sum(len(page.page_content) for page in pages)
-            }
-        
-        return {'total_pages': 0, 'first_page_chars': 0, 'total_characters': 0}
+    except Exception as e:
+        logger.error("Error extracting metadata: %s", e)
+        return {'error': str(e)}
+
+
+# ==============================================
+# WARM-UP
+# ==============================================
+
+def _warm_up_mupdf() -> None:
+    """
+    Run a tiny PDF through the extraction path once.
+    
+    The first parse pays for MuPDF's lazy initialization (font and
+    resource tables); doing it at import takes a few milliseconds and
+    keeps it off the first upload.
+    """
+    with _pdf_lock:
+        doc = pymupdf.open()
+        doc.new_page()
+        data = doc.tobytes()
+        doc.close()
         
+        with _open_pdf(data) as warm_doc:
+            _page_text(warm_doc[0])
+
+
+def _warm_up() -> None:
+    """Pay one-time initialization costs before the first CV arrives."""
+    try:
+        # MuPDF warms up on the importing thread, so the first upload never
+        # waits for it on the PDF lock
+        _warm_up_mupdf()
     except Exception as e:
-        print(f"Error extracting metadata: {str(e)}")
-        return {'error': str(e)}
\ No newline at end of file
+        logger.warning("CV loader warm-up failed: %s", e)
+
+
+_warm_up()
@@ -9,17 +9,43 @@ Supported Providers:
     - OpenAI (GPT-4)
     - Groq (Llama models)
     - Local Llama (via Ollama)
+    - Self-hosted models (via a vLLM server)
 
 Environment Variables Required:
     - OPENAI_API_KEY: For OpenAI models
     - GROQ_API_KEY: For Groq models
     - LLM_NAME: Specifies which provider to use ('openai', 'groq', 'llama3')
+
+Optional Environment Variables:
+    - LLM_CACHE_ENABLED: Cache responses even for non-zero temperatures
+    - LLM_CACHE_BACKEND: Response cache backend ('memory' or 'redis')
+    - VLLM_BASE_URL: OpenAI-compatible endpoint of a vLLM server
+    - VLLM_MODEL: Model served by the vLLM server
+    - VLLM_API_KEY: API key, if the vLLM server was started with one
 """
 
+import asyncio
+import atexit
+import hashlib
+import importlib.util
+import logging
 import os
-from typing import Union, Optional
-from langchain_openai import ChatOpenAI
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Union, Optional
+import httpx
+import openai
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_groq import ChatGroq
+from langchain_core.caches import BaseCache
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+
+from cache import get_response_cache
+
+
+logger = logging.getLogger(__name__)
 
 
 # Model configuration constants
@@ -37,11 +63,217 @@ GROQ_MODELS = {
 DEFAULT_TEMPERATURES = {
     'openai': 0.1,
     'groq': 0.2,
-    'llama3': 0.0
+    'llama3': 0.0,
+    'vllm': 0.1
 }
 
 # Local Ollama configuration
 OLLAMA_BASE_URL = "http://localhost:11434/v1"
+OLLAMA_MODEL = 'llama3'
+
+# Self-hosted vLLM server. vLLM batches concurrent requests continuously
+# on the GPU and, when started with --enable-prefix-caching, reuses the
+# shared prompt prefix (instructions + CV) across letters, e.g.:
+#   vllm serve meta-llama/Llama-3.1-8B-Instruct --enable-prefix-caching --max-num-seqs 256
+VLLM_BASE_URL = os.environ.get("VLLM_BASE_URL", "http://localhost:8000/v1")
+VLLM_MODEL = os.environ.get("VLLM_MODEL", "meta-llama/Llama-3.1-8B-Instruct")
+
+# Per-provider defaults resolved once at import
+_OPENAI_MODEL = OPENAI_MODELS['gpt-4']
+_GROQ_MODEL = GROQ_MODELS['llama3-70b']
+_OPENAI_TEMPERATURE = DEFAULT_TEMPERATURES['openai']
+_GROQ_TEMPERATURE = DEFAULT_TEMPERATURES['groq']
+_LLAMA3_TEMPERATURE = DEFAULT_TEMPERATURES['llama3']
+_VLLM_TEMPERATURE = DEFAULT_TEMPERATURES['vllm']
+
+# Cheap endpoints requested at startup to open pooled connections early,
+# as (url, API key environment variable)
+WARMUP_ENDPOINTS = {
+    'openai': ("https://api.openai.com/v1/models", "OPENAI_API_KEY"),
+    'groq': ("https://api.groq.com/openai/v1/models", "GROQ_API_KEY"),
+    'llama3': ("http://localhost:11434/api/tags", None),
+    'vllm': (f"{VLLM_BASE_URL}/models", None)
+}
+WARMUP_TIMEOUT = 2
+
+# Embedding model used for semantic caching
+OPENAI_EMBEDDING_MODEL = 'text-embedding-3-small'
+
+# Per-request timeout (seconds) for hosted LLM APIs
+LLM_REQUEST_TIMEOUT = 45
+
+# Retries for rate-limited, timed-out or 5xx requests; the provider SDKs
+# back off exponentially with jitter between attempts
+LLM_MAX_RETRIES = 3
+
+# Connection pool shared by every async LLM client, sized for parallel
+# agent fan-out rather than httpx's per-client defaults
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=512, max_keepalive_connections=256)
+HTTP_TIMEOUT = 60
+
+# Multiplex concurrent requests over one connection when h2 is installed
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Cache responses of non-deterministic models too (opt-in)
+LLM_CACHE_ENABLED = os.environ.get("LLM_CACHE_ENABLED", "").lower() in ("1", "true", "yes")
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Model instances keyed by provider and configuration, so repeated loads
+# reuse one client (and its warm connection pool) instead of rebuilding it
+_client_cache: Dict[tuple, BaseChatModel] = {}
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client used by all LLM providers.
+    
+    Agents running in parallel reuse its keep-alive connections instead of
+    each provider client opening its own pool and TLS sessions.
+    
+    Returns:
+        httpx.AsyncClient: Shared async HTTP client
+    """
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=HTTP_POOL_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            http2=HTTP2_ENABLED
+        )
+    return _http_client
+
+
+async def close_shared_http_client() -> None:
+    """
+    Close the shared async HTTP client and its pooled connections.
+    
+    Call this from the event loop that used the client. A later call to
+    `_shared_http_client` opens a new one.
+    """
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+
+
+@atexit.register
+def _close_http_client_at_exit() -> None:
+    """Release pooled connections when the interpreter shuts down."""
+    if _http_client is None or _http_client.is_closed:
+        return
+    
+    try:
+        asyncio.run(close_shared_http_client())
+    except Exception:
+        # The loop that owned the connections may already be gone; the
+        # sockets are released with the process either way
+        pass
+
+
+def _openai_async_client(api_key: str, base_url: Optional[str] = None, timeout: float = HTTP_TIMEOUT):
+    """
+    Build an async OpenAI completions client on top of the shared HTTP client.
+    
+    ChatOpenAI forwards a single `http_client` to both its sync and async
+    SDK clients, so the async client is constructed here and passed in
+    directly instead. Its retry policy is set here too, since ChatOpenAI's
+    own `max_retries` only applies to clients it builds itself.
+    
+    Args:
+        api_key (str): API key for the endpoint
+        base_url (Optional[str]): OpenAI-compatible endpoint, None for OpenAI
+        timeout (float): Request timeout in seconds
+        
+    Returns:
+        Async chat completions resource for ChatOpenAI's `async_client`
+    """
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=timeout,
+        max_retries=LLM_MAX_RETRIES,
+        http_client=_shared_http_client()
+    ).chat.completions
+
+
+@lru_cache(maxsize=None)
+def _env(key: str) -> str:
+    """
+    Read a required environment variable once and memoize it.
+    
+    Missing variables raise KeyError and are not cached, so setting one
+    later still takes effect. `reset_llm_cache` clears the memoized values
+    after credentials are rotated.
+    
+    Args:
+        key (str): Environment variable name
+        
+    Returns:
+        str: Value of the variable
+        
+    Raises:
+        KeyError: If the variable is not set
+    """
+    return os.environ[key]
+
+
+def _response_cache(temperature: float) -> Optional[BaseCache]:
+    """
+    Pick the response cache for a model with the given temperature.
+    
+    Replaying a stored answer is only safe when the model would give the same
+    answer again, so caching is limited to temperature 0 unless
+    LLM_CACHE_ENABLED opts in for every model. LangChain applies the cache
+    to invoke and batch calls only; `astream` always reaches the provider.
+    
+    Args:
+        temperature (float): Sampling temperature of the model
+        
+    Returns:
+        Optional[BaseCache]: Shared response cache, or None to disable caching
+    """
+    if temperature == 0 or LLM_CACHE_ENABLED:
+        return get_response_cache()
+    return None
+
+
+def _config_key(llm_name: str, config: Dict[str, Any]) -> tuple:
+    """
+    Build a hashable client cache key for a provider and its configuration.
+    
+    API key values are replaced by their SHA-256 digest so the cache never
+    holds secrets in its keys, and unhashable values fall back to `repr`.
+    
+    Args:
+        llm_name (str): Name of the LLM provider
+        config (Dict[str, Any]): Custom configuration parameters
+        
+    Returns:
+        tuple: Cache key for `_client_cache`
+    """
+    items = []
+    for name, value in sorted(config.items()):
+        if 'api_key' in name and value is not None:
+            value = hashlib.sha256(str(value).encode()).hexdigest()
+        else:
+            try:
+                hash(value)
+            except TypeError:
+                value = repr(value)
+        items.append((name, value))
+    
+    return (llm_name.lower(), tuple(items))
+
+
+def reset_llm_cache() -> None:
+    """
+    Drop every cached model instance.
+    
+    The next `load_llm` or `switch_model_config` call builds a fresh client,
+    which picks up changed environment variables after a hot reload.
+    """
+    _client_cache.clear()
+    _env.cache_clear()
 
 
 def load_llm(llm_name: str) -> Union[ChatOpenAI, ChatGroq]:
@@ -50,10 +282,12 @@ def load_llm(llm_name: str) -> Union[ChatOpenAI, ChatGroq]:
     
     This function initializes different LLM providers with appropriate configurations
     including API keys, model names, and parameters optimized for each provider.
+    Instances are cached per provider, so repeated calls return the same client;
+    use `reset_llm_cache` to force a rebuild.
     
     Args:
         llm_name (str): Name of the LLM provider to load. 
-                       Options: 'openai', 'groq', 'llama3'
+                       Options: 'openai', 'groq', 'llama3', 'vllm'
                        
     Returns:
         Union[ChatOpenAI, ChatGroq]: Configured LLM instance ready for use
@@ -67,19 +301,28 @@ def load_llm(llm_name: str) -> Union[ChatOpenAI, ChatGroq]:
         >>> response = llm.invoke("Hello, world!")
     """
     
-    print(f"Initializing LLM provider: {llm_name}")
+    key = (llm_name.lower(),)
+    if key in _client_cache:
+        return _client_cache[key]
+    
+    logger.info("Initializing LLM provider: %s", llm_name)
     
     if llm_name.lower() == 'openai':
-        return _load_openai_model()
+        llm = _load_openai_model()
     elif llm_name.lower() == 'groq':
-        return _load_groq_model()
+        llm = _load_groq_model()
     elif llm_name.lower() == 'llama3':
-        return _load_local_llama_model()
+        llm = _load_local_llama_model()
+    elif llm_name.lower() == 'vllm':
+        llm = _load_vllm_model()
     else:
         raise ValueError(
             f"Unsupported LLM name: {llm_name}. "
             f"Supported options: {list(DEFAULT_TEMPERATURES.keys())}"
         )
+    
+    _client_cache[key] = llm
+    return llm
 
 
 def _load_openai_model() -> ChatOpenAI:
@@ -93,19 +336,22 @@ def _load_openai_model() -> ChatOpenAI:
         KeyError: If OPENAI_API_KEY environment variable is not set
     """
     try:
-        api_key = os.environ["OPENAI_API_KEY"]
+        api_key = _env("OPENAI_API_KEY")
         
         # Initialize OpenAI model with optimized parameters
         llm = ChatOpenAI(
-            model_name=OPENAI_MODELS['gpt-4'],
+            model_name=_OPENAI_MODEL,
             openai_api_key=api_key,
-            temperature=DEFAULT_TEMPERATURES['openai'],
+            temperature=_OPENAI_TEMPERATURE,
             streaming=True,  # Enable streaming for better UX
             max_tokens=None,  # No token limit
-            timeout=60  # 60 second timeout
+            timeout=LLM_REQUEST_TIMEOUT,
+            max_retries=LLM_MAX_RETRIES,
+            async_client=_openai_async_client(api_key, timeout=LLM_REQUEST_TIMEOUT),
+            cache=_response_cache(_OPENAI_TEMPERATURE)
         )
         
-        print("✅ OpenAI GPT-4 model loaded successfully")
+        logger.info("OpenAI GPT-4 model loaded successfully")
         return llm
         
     except KeyError:
@@ -114,7 +360,7 @@ def _load_openai_model() -> ChatOpenAI:
             "Please set it in your .env file or environment."
         )
     except Exception as e:
-        print(f"❌ Error loading OpenAI model: {str(e)}")
+        logger.error("Error loading OpenAI model: %s", e)
         raise
 
 
@@ -129,19 +375,22 @@ def _load_groq_model() -> ChatGroq:
         KeyError: If GROQ_API_KEY environment variable is not set
     """
     try:
-        api_key = os.environ["GROQ_API_KEY"]
+        api_key = _env("GROQ_API_KEY")
         
         # Initialize Groq model with optimized parameters
         llm = ChatGroq(
-            temperature=DEFAULT_TEMPERATURES['groq'],
+            temperature=_GROQ_TEMPERATURE,
             groq_api_key=api_key,
-            model_name=GROQ_MODELS['llama3-70b'],  # Use Llama3 70B by default
+            model_name=_GROQ_MODEL,  # Use Llama3 70B by default
             max_tokens=None,
-            timeout=60
+            timeout=LLM_REQUEST_TIMEOUT,
+            max_retries=LLM_MAX_RETRIES,
+            http_async_client=_shared_http_client(),
+            cache=_response_cache(_GROQ_TEMPERATURE)
         )
         
-        print("✅ Groq Llama3-70B model loaded successfully")
-        print("⚠️  Note: Groq models may be unstable due to routing/token limit issues")
+        logger.info("Groq Llama3-70B model loaded successfully")
+        logger.warning("Groq models may be unstable due to routing/token limit issues")
         return llm
         
     except KeyError:
@@ -150,7 +399,7 @@ def _load_groq_model() -> ChatGroq:
             "Please set it in your .env file or environment."
         )
     except Exception as e:
-        print(f"❌ Error loading Groq model: {str(e)}")
+        logger.error("Error loading Groq model: %s", e)
         raise
 
 
@@ -170,23 +419,198 @@ def _load_local_llama_model() -> ChatOpenAI:
     try:
         # Initialize local Llama model via Ollama
         llm = ChatOpenAI(
-            model="llama3",
+            model=OLLAMA_MODEL,
             base_url=OLLAMA_BASE_URL,
-            temperature=DEFAULT_TEMPERATURES['llama3'],
+            temperature=_LLAMA3_TEMPERATURE,
             api_key="ollama",  # Dummy API key for local usage
-            timeout=120  # Longer timeout for local models
+            timeout=120,  # Longer timeout for local models
+            max_retries=LLM_MAX_RETRIES,
+            async_client=_openai_async_client("ollama", OLLAMA_BASE_URL, timeout=120),
+            cache=_response_cache(_LLAMA3_TEMPERATURE)
+        )
+        
+        logger.info("Local Llama3 model loaded successfully from %s", OLLAMA_BASE_URL)
+        return llm
+        
+    except Exception as e:
+        logger.error(
+            "Error loading local Llama model: %s. Make sure Ollama is running on %s",
+            e, OLLAMA_BASE_URL
+        )
+        raise
+
+
+def load_embeddings(llm_name: str) -> Optional[OpenAIEmbeddings]:
+    """
+    Load the embedding model used for semantic caching.
+    
+    Only OpenAI provides an embeddings endpoint among the supported
+    providers, so other providers get None and callers skip the features
+    that depend on embeddings.
+    
+    Args:
+        llm_name (str): Name of the LLM provider ('openai', 'groq', 'llama3')
+        
+    Returns:
+        Optional[OpenAIEmbeddings]: Embedding model, or None if unavailable
+    """
+    if llm_name.lower() != 'openai':
+        return None
+    
+    return OpenAIEmbeddings(
+        model=OPENAI_EMBEDDING_MODEL,
+        openai_api_key=_env("OPENAI_API_KEY")
+    )
+
+
+def _load_vllm_model() -> ChatOpenAI:
+    """
+    Load a model served by a self-hosted vLLM server.
+    
+    vLLM exposes an OpenAI-compatible API, so the OpenAI client is pointed
+    at VLLM_BASE_URL. Requests from concurrent users are merged into shared
+    GPU steps by the server's continuous batching, which suits the many
+    independent cover letter requests.
+    
+    Returns:
+        ChatOpenAI: Configured vLLM model instance
+        
+    Note:
+        Requires a vLLM server running at VLLM_BASE_URL serving VLLM_MODEL
+    """
+    try:
+        # vLLM only checks the key when started with --api-key
+        api_key = os.environ.get("VLLM_API_KEY", "EMPTY")
+        
+        llm = ChatOpenAI(
+            model=VLLM_MODEL,
+            base_url=VLLM_BASE_URL,
+            temperature=_VLLM_TEMPERATURE,
+            api_key=api_key,
+            timeout=LLM_REQUEST_TIMEOUT,
+            max_retries=LLM_MAX_RETRIES,
+            async_client=_openai_async_client(api_key, VLLM_BASE_URL, timeout=LLM_REQUEST_TIMEOUT),
+            cache=_response_cache(_VLLM_TEMPERATURE)
         )
         
-        print("✅ Local Llama3 model loaded successfully")
-        print(f"🔗 Using Ollama endpoint: {OLLAMA_BASE_URL}")
+        logger.info("vLLM model %s loaded from %s", VLLM_MODEL, VLLM_BASE_URL)
         return llm
         
     except Exception as e:
-        print(f"❌ Error loading local Llama model: {str(e)}")
-        print("💡 Make sure Ollama is running locally on http://localhost:11434")
+        logger.error(
+            "Error loading vLLM model: %s. Make sure a vLLM server is running on %s",
+            e, VLLM_BASE_URL
+        )
         raise
 
 
+async def warm_up(llm_name: str) -> bool:
+    """
+    Open a pooled connection to the provider before the first real request.
+    
+    Issues a small GET against the provider's model listing so the DNS,
+    TCP and TLS setup happens at startup instead of delaying the first
+    agent response. Must run on the event loop that later serves the
+    requests, since the shared HTTP client's connections belong to it.
+    Failures are ignored; the first request then simply connects itself.
+    
+    Args:
+        llm_name (str): Name of the LLM provider ('openai', 'groq', 'llama3')
+        
+    Returns:
+        bool: True if the endpoint answered, False otherwise
+    """
+    endpoint = WARMUP_ENDPOINTS.get(llm_name.lower())
+    if endpoint is None:
+        return False
+    
+    url, key_var = endpoint
+    headers = {}
+    
+    try:
+        if key_var is not None:
+            headers["Authorization"] = f"Bearer {_env(key_var)}"
+        
+        await _shared_http_client().get(url, headers=headers, timeout=WARMUP_TIMEOUT)
+        return True
+    except Exception as e:
+        logger.warning("Connection warm-up for %s failed: %s", llm_name, e)
+        return False
+
+
+# Batched inference
+
+# Default number of concurrent requests per batch
+INFER_BATCH_CONCURRENCY = 8
+
+
+class InferenceEngine(ABC):
+    """
+    Interface for running many independent LLM requests as one batch.
+    
+    Callers that need the same kind of answer for N inputs (e.g. one
+    assessment per job listing) submit them together instead of looping
+    over single calls, and the engine decides how to execute them.
+    
+    Requests that share context should put it first and in identical form
+    (e.g. the CV as the leading system message, the job as the trailing
+    human message): providers with automatic prefix caching then only
+    process the shared prefix once.
+    """
+    
+    @abstractmethod
+    async def infer_batch(
+        self,
+        requests: Sequence[LanguageModelInput],
+        config: Optional[RunnableConfig] = None
+    ) -> List[BaseMessage]:
+        """
+        Run every request and return the responses in request order.
+        
+        Args:
+            requests (Sequence[LanguageModelInput]): Prompts or message lists
+            config (Optional[RunnableConfig]): Config applied to every request
+            
+        Returns:
+            List[BaseMessage]: One response per request
+        """
+
+
+class ConcurrentInferenceEngine(InferenceEngine):
+    """
+    Inference engine that fans requests out as concurrent API calls.
+    
+    Requests are sent in parallel over the shared connection pool, with at
+    most `max_concurrency` in flight to stay within provider rate limits.
+    This serves every supported provider; OpenAI's /v1/batches endpoint is
+    not used because it completes asynchronously within hours, which does
+    not fit an interactive chat.
+    
+    Args:
+        llm (BaseChatModel): Chat model to send the requests to
+        max_concurrency (int): Maximum number of requests in flight
+        
+    Example:
+        >>> engine = ConcurrentInferenceEngine(load_llm('openai'))
+        >>> replies = await engine.infer_batch([[cv_msg, job] for job in jobs])
+    """
+    
+    def __init__(self, llm: BaseChatModel, max_concurrency: int = INFER_BATCH_CONCURRENCY):
+        self.llm = llm
+        self.max_concurrency = max_concurrency
+    
+    async def infer_batch(
+        self,
+        requests: Sequence[LanguageModelInput],
+        config: Optional[RunnableConfig] = None
+    ) -> List[BaseMessage]:
+        if not requests:
+            return []
+        
+        config = {**(config or {}), "max_concurrency": self.max_concurrency}
+        return await self.llm.abatch(list(requests), config=config)
+
+
 # Utility functions for model management
 
 def get_available_models() -> dict:
@@ -214,6 +638,12 @@ def get_available_models() -> dict:
             'default_temperature': DEFAULT_TEMPERATURES['llama3'],
             'requires_api_key': False,
             'base_url': OLLAMA_BASE_URL
+        },
+        'vllm': {
+            'models': {'vllm': VLLM_MODEL},
+            'default_temperature': DEFAULT_TEMPERATURES['vllm'],
+            'requires_api_key': False,
+            'base_url': VLLM_BASE_URL
         }
     }
 
@@ -248,6 +678,9 @@ def validate_environment(llm_name: str) -> dict:
     elif llm_name.lower() == 'llama3':
         validation_result['warnings'].append('Requires Ollama running on localhost:11434')
     
+    elif llm_name.lower() == 'vllm':
+        validation_result['warnings'].append(f'Requires a vLLM server running on {VLLM_BASE_URL}')
+    
     else:
         validation_result['valid'] = False
         validation_result['missing_vars'].append(f'Unsupported LLM: {llm_name}')
@@ -275,6 +708,9 @@ def switch_model_config(llm_name: str, **kwargs) -> Union[ChatOpenAI, ChatGroq]:
     """
     Load a model with custom configuration parameters.
     
+    Instances are cached per provider and configuration, so loading the same
+    configuration twice returns the same client.
+    
     Args:
         llm_name (str): Name of the LLM provider
         **kwargs: Custom configuration parameters
@@ -282,32 +718,50 @@ def switch_model_config(llm_name: str, **kwargs) -> Union[ChatOpenAI, ChatGroq]:
     Returns:
         Union[ChatOpenAI, ChatGroq]: Configured LLM instance
     """
-    print(f"Loading {llm_name} with custom config: {kwargs}")
+    key = _config_key(llm_name, kwargs)
+    if key in _client_cache:
+        return _client_cache[key]
     
-    # Override default parameters with custom ones
-    custom_temp = kwargs.get('temperature', DEFAULT_TEMPERATURES.get(llm_name, 0.1))
+    logger.info("Loading %s with custom config: %s", llm_name, sorted(kwargs))
     
+    llm = _build_custom_model(llm_name, **kwargs)
+    _client_cache[key] = llm
+    return llm
+
+
+def _build_custom_model(llm_name: str, **kwargs) -> Union[ChatOpenAI, ChatGroq]:
+    """Construct an uncached model instance for `switch_model_config`."""
+    # Override default parameters with custom ones
     if llm_name.lower() == 'openai':
         return ChatOpenAI(
-            model_name=kwargs.get('model', OPENAI_MODELS['gpt-4']),
-            openai_api_key=os.environ["OPENAI_API_KEY"],
-            temperature=custom_temp,
+            model_name=kwargs.get('model', _OPENAI_MODEL),
+            openai_api_key=_env("OPENAI_API_KEY"),
+            temperature=kwargs.get('temperature', _OPENAI_TEMPERATURE),
             **{k: v for k, v in kwargs.items() if k not in ['model', 'temperature']}
         )
     
     elif llm_name.lower() == 'groq':
         return ChatGroq(
-            model_name=kwargs.get('model', GROQ_MODELS['llama3-70b']),
-            groq_api_key=os.environ["GROQ_API_KEY"],
-            temperature=custom_temp,
+            model_name=kwargs.get('model', _GROQ_MODEL),
+            groq_api_key=_env("GROQ_API_KEY"),
+            temperature=kwargs.get('temperature', _GROQ_TEMPERATURE),
             **{k: v for k, v in kwargs.items() if k not in ['model', 'temperature']}
         )
     
     elif llm_name.lower() == 'llama3':
         return ChatOpenAI(
-            model=kwargs.get('model', 'llama3'),
+            model=kwargs.get('model', OLLAMA_MODEL),
             base_url=kwargs.get('base_url', OLLAMA_BASE_URL),
-            temperature=custom_temp,
+            temperature=kwargs.get('temperature', _LLAMA3_TEMPERATURE),
+            **{k: v for k, v in kwargs.items() if k not in ['model', 'base_url', 'temperature']}
+        )
+    
+    elif llm_name.lower() == 'vllm':
+        return ChatOpenAI(
+            model=kwargs.get('model', VLLM_MODEL),
+            base_url=kwargs.get('base_url', VLLM_BASE_URL),
+            api_key=os.environ.get("VLLM_API_KEY", "EMPTY"),
+            temperature=kwargs.get('temperature', _VLLM_TEMPERATURE),
             **{k: v for k, v in kwargs.items() if k not in ['model', 'base_url', 'temperature']}
         )
     
@@ -2,9 +2,22 @@
 Prompt templates and configurations for different LLM providers.
 
 This module contains all prompt templates used by the multi-agent system,
-with support for different LLM providers (OpenAI, Groq/Llama3).
+with support for different LLM providers (OpenAI, Groq/Llama3). The local
+Llama3 provider shares the Groq templates since both serve Llama3 models.
+
+Prompt layout:
+    Every template puts its static system text first and the per-request
+    conversation after it, and values such as {members} and {options} are
+    bound once with `.partial` rather than per call. The rendered prefix is
+    therefore byte-identical across calls, which is what provider-side prefix
+    caching keys on: OpenAI caches such prefixes automatically once a request
+    exceeds 1024 tokens, with no request flag required. Keep new per-request
+    values out of the system messages to preserve this.
 """
 
+from functools import lru_cache
+from typing import Sequence
+
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 
 # Llama3 specific template markers for proper formatting
@@ -12,18 +25,27 @@ LLAMA3_BEGIN_TEMPLATE = "<|begin_of_text|><|start_header_id|>system<|end_header_
 LLAMA3_END_TEMPLATE = " <|eot_id|> <|start_header_id|>assistant<|end_header_id|>"
 
 
-def routing_prompt(llm_name: str, options: list, members: list) -> ChatPromptTemplate:
+def routing_prompt(llm_name: str, options: Sequence[str], members: Sequence[str]) -> ChatPromptTemplate:
     """
     Create routing prompt for supervisor agent to decide next action.
     
+    Templates are memoized, so repeated calls with the same provider and
+    workers return the same instance instead of rebuilding it.
+    
     Args:
-        llm_name (str): Name of the LLM provider ('openai' or 'groq')
-        options (list): Available routing options including agents and 'FINISH'
-        members (list): List of available agent members
+        llm_name (str): Name of the LLM provider ('openai', 'groq' or 'llama3')
+        options (Sequence[str]): Available routing options including agents and 'FINISH'
+        members (Sequence[str]): List of available agent members
         
     Returns:
         ChatPromptTemplate: Configured prompt template for routing decisions
     """
+    return _build_routing_prompt(llm_name, tuple(options), tuple(members))
+
+
+@lru_cache(maxsize=32)
+def _build_routing_prompt(llm_name: str, options: tuple, members: tuple) -> ChatPromptTemplate:
+    """Build the routing prompt; hashable tuple arguments make it cacheable."""
     system_prompt = get_system_prompt(llm_name)
 
     if llm_name == 'openai':
@@ -33,11 +55,13 @@ def routing_prompt(llm_name: str, options: list, members: list) -> ChatPromptTem
             (
                 "system", 
                 "Given the conversation above, who should act next? "
-                "Or is the task complete and should we FINISH? Select one of: {options}"
+                "Or is the task complete and should we FINISH? Select from: {options}. "
+                "If several workers can act independently of each other's results, "
+                "select all of them at once so they run in parallel."
             ),
-        ]).partial(options=str(options), members=", ".join(members))
+        ]).partial(options=str(list(options)), members=", ".join(members))
         
-    elif llm_name == 'groq':
+    elif llm_name in ('groq', 'llama3'):
         prompt = ChatPromptTemplate.from_messages([
             ("system", system_prompt),
             MessagesPlaceholder(variable_name="messages"),
@@ -45,20 +69,23 @@ def routing_prompt(llm_name: str, options: list, members: list) -> ChatPromptTem
                 "system", 
                 LLAMA3_BEGIN_TEMPLATE + 
                 "Summarize and assess the conversation. Given the conversation above, who should act next? "
-                "Or is the task complete and should we FINISH? Select one of: {options}" + 
+                "Or is the task complete and should we FINISH? Select from: {options}. "
+                "If several workers can act independently of each other's results, "
+                "select all of them at once so they run in parallel." + 
                 LLAMA3_END_TEMPLATE
             ),
-        ]).partial(options=str(options), members=", ".join(members))
+        ]).partial(options=str(list(options)), members=", ".join(members))
         
     return prompt
 
 
+@lru_cache(maxsize=8)
 def get_system_prompt(llm_name: str) -> str:
     """
     Get the system prompt for supervisor agent based on LLM provider.
     
     Args:
-        llm_name (str): Name of the LLM provider ('openai' or 'groq')
+        llm_name (str): Name of the LLM provider ('openai', 'groq' or 'llama3')
         
     Returns:
         str: System prompt template for supervisor agent
@@ -67,49 +94,74 @@ def get_system_prompt(llm_name: str) -> str:
         return (
             "You are a supervisor agent tasked with managing a conversation between the "
             "following workers: {members}. User has uploaded a document and sent a query. "
-            "Given the uploaded document and following user request, respond with the worker to act next. "
+            "Given the uploaded document and following user request, respond with the worker(s) to act next. "
             "Each worker will perform a task and respond with their results and status. "
             "Only route the tasks based on the router if there is anything to route or task is not complete. "
+            "Only involve the Analyzer when the request needs the CV's content; a plain job search "
+            "needs the Searcher alone. "
             "When finished, respond with FINISH."
         )
-    elif llm_name == 'groq':
+    elif llm_name in ('groq', 'llama3'):
         return (
             LLAMA3_BEGIN_TEMPLATE + 
             "You are a supervisor agent tasked with managing a conversation between the "
             "following workers: {members}. User has uploaded a CV and sent a query. "
-            "Given the uploaded CV and following user request, respond with the worker to act next. "
+            "Given the uploaded CV and following user request, respond with the worker(s) to act next. "
             "Each worker will perform a task and respond with their results and status. "
             "After the result: ask yourself from the original query if the task is satisfied? "
             "Based on that pass it to next appropriate route. "
+            "Only involve the Analyzer when the request needs the CV's content; a plain job search "
+            "needs the Searcher alone. "
             "When task is finished, respond with FINISH." +
             LLAMA3_END_TEMPLATE
         )
 
 
+# Worker agent prompts
+BASE_SEARCH_PROMPT = (
+    "Search for job listings based on user-specified parameters, "
+    "DISPLAY job title, company URL, location, and a summary. "
+    "If unsuccessful, retry with alternative keywords up to three times and provide the results"
+)
+BASE_ANALYZER_PROMPT = (
+    "Analyze the content of a user-uploaded document and matching job listings "
+    "to recommend the best job fit, detailing the reasons behind the choice."
+)
+BASE_GENERATOR_PROMPT = "Generate a personalized cover letter based on an uploaded CV and provide the text output."
+
+_LLAMA3_AGENT_PROMPTS = {
+    'search': f"{LLAMA3_BEGIN_TEMPLATE}You are a Searcher Agent. {BASE_SEARCH_PROMPT}{LLAMA3_END_TEMPLATE}",
+    'analyzer': (
+        f"{LLAMA3_BEGIN_TEMPLATE}You are an Analyzer Agent. "
+        "Analyze the content of the user-uploaded CV and matching job listings "
+        f"to recommend the best job fit, detailing the reasons behind the choice.{LLAMA3_END_TEMPLATE}"
+    ),
+    'generator': f"{LLAMA3_BEGIN_TEMPLATE}You are a Generator Agent. {BASE_GENERATOR_PROMPT}{LLAMA3_END_TEMPLATE}",
+}
+
+# Fully rendered worker prompts per provider, built once at import
+_PROMPTS = {
+    'openai': {
+        'search': BASE_SEARCH_PROMPT,
+        'analyzer': BASE_ANALYZER_PROMPT,
+        'generator': BASE_GENERATOR_PROMPT,
+    },
+    'groq': _LLAMA3_AGENT_PROMPTS,
+    'llama3': _LLAMA3_AGENT_PROMPTS,
+}
+
+
 def get_search_agent_prompt(llm_name: str) -> str:
     """
     Get the prompt for search agent based on LLM provider.
     
     Args:
-        llm_name (str): Name of the LLM provider ('openai' or 'groq')
+        llm_name (str): Name of the LLM provider ('openai', 'groq' or 'llama3')
         
     Returns:
         str: Prompt for search agent
     """
-    base_prompt = (
-        "Search for job listings based on user-specified parameters, "
-        "DISPLAY job title, company URL, location, and a summary. "
-        "If unsuccessful, retry with alternative keywords up to three times and provide the results"
-    )
-    
-    if llm_name == 'openai':
-        return base_prompt
-    elif llm_name == 'groq':
-        return (
-            LLAMA3_BEGIN_TEMPLATE + 
-            "You are a Searcher Agent. " + base_prompt + 
-            LLAMA3_END_TEMPLATE
-        )
+    return _PROMPTS[llm_name]['search']
 
 
 def get_analyzer_agent_prompt(llm_name: str) -> str:
@@ -117,26 +169,12 @@ def get_analyzer_agent_prompt(llm_name: str) -> str:
     Get the prompt for analyzer agent based on LLM provider.
     
     Args:
-        llm_name (str): Name of the LLM provider ('openai' or 'groq')
+        llm_name (str): Name of the LLM provider ('openai', 'groq' or 'llama3')
         
     Returns:
         str: Prompt for analyzer agent
     """
-    base_prompt = (
-        "Analyze the content of a user-uploaded document and matching job listings "
-        "to recommend the best job fit, detailing the reasons behind the choice."
-    )
-    
-    if llm_name == 'openai':
-        return base_prompt
-    elif llm_name == 'groq':
-        return (
-            LLAMA3_BEGIN_TEMPLATE + 
-            "You are an Analyzer Agent. "
-            "Analyze the content of the user-uploaded CV and matching job listings "
-            "to recommend the best job fit, detailing the reasons behind the choice." + 
-            LLAMA3_END_TEMPLATE
-        )
+    return _PROMPTS[llm_name]['analyzer']
 
 
 def get_generator_agent_prompt(llm_name: str) -> str:
@@ -144,21 +182,65 @@ def get_generator_agent_prompt(llm_name: str) -> str:
     Get the prompt for generator agent based on LLM provider.
     
     Args:
-        llm_name (str): Name of the LLM provider ('openai' or 'groq')
+        llm_name (str): Name of the LLM provider ('openai', 'groq' or 'llama3')
         
     Returns:
         str: Prompt for generator agent
     """
-    base_prompt = "Generate a personalized cover letter based on an uploaded CV and provide the text output."
-    
-    if llm_name == 'openai':
-        return base_prompt
-    elif llm_name == 'groq':
-        return (
-            LLAMA3_BEGIN_TEMPLATE + 
-            "You are a Generator Agent. " + base_prompt + 
-            LLAMA3_END_TEMPLATE
-        )
+    return _PROMPTS[llm_name]['generator']
+
+
+# Cover letter generation. The static instructions come first, then the CV
+# (identical for every job), then the job, so letters for several jobs
+# share the longest possible prompt prefix
+COVER_LETTER_INSTRUCTIONS = (
+    "You write personalized cover letters. Using the candidate's CV and the job "
+    "posting provided, write a cover letter that articulates how the applicant's "
+    "skills and experiences align with the job requirements. The letter should:\n"
+    "- Open with enthusiasm for the specific role\n"
+    "- Highlight the 2-3 most relevant qualifications\n"
+    "- Demonstrate knowledge of the company\n"
+    "- Close with a strong call to action\n"
+    "- Maintain a professional yet engaging tone\n"
+    "Return only the text of the letter."
+)
+
+COVER_LETTER_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", COVER_LETTER_INSTRUCTIONS),
+    ("human", "CV:\n{cv_details}\n\nJOB:\n{job_details}\n\nWrite the cover letter for this job."),
+])
+
+
+# Long CVs are condensed section by section before the letter is written:
+# each section is read against the job by its own small call, and only the
+# relevant points reach the letter prompt
+CV_SECTION_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        "You select the parts of a candidate's CV that matter for a job. From the "
+        "CV section given, list the facts most relevant to the job posting: roles, "
+        "achievements, skills, degrees, with names, dates and numbers kept exact. "
+        "Respond with a JSON object of the form {{\"highlights\": [\"...\"]}} and "
+        "an empty list if nothing in the section is relevant."
+    ),
+    ("human", "CV SECTION ({section}):\n{section_text}\n\nJOB:\n{job_details}"),
+])
+
+
+# Several letters from one completion: the CV is sent once, followed by
+# every job, and the letters come back split by numbered markers
+COVER_LETTER_MARKER = "<<<LETTER {index}>>>"
+
+COVER_LETTERS_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", COVER_LETTER_INSTRUCTIONS),
+    (
+        "human",
+        "CV:\n{cv_details}\n\n{job_blocks}\n\n"
+        "Write one cover letter for each job above, in order. Start each letter "
+        "with its marker line, e.g. {first_marker}, and write nothing else "
+        "outside the letters."
+    ),
+])
 
 
 # Example usage documentation
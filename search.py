@@ -10,30 +10,176 @@ Terms of Service. Use at your own risk.
 
 Dependencies:
     - linkedin-api: Unofficial LinkedIn API wrapper
-    - nest-asyncio: For handling async operations in Jupyter/Streamlit environments
+    - diskcache: Persistent cache for job detail responses
 """
 
 import os
 import asyncio
-from typing import List, Dict, Optional, Any
-import nest_asyncio
-
-# Apply nest_asyncio to handle event loop conflicts in Jupyter/Streamlit
-nest_asyncio.apply()
+import atexit
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Any
 
+import diskcache
 from linkedin_api import Linkedin
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+
+# (connect, read) timeout in seconds for LinkedIn HTTP requests
+LINKEDIN_TIMEOUT = (5, 30)
+
+# Overall time allowed for the login, which takes up to three requests
+LINKEDIN_LOGIN_TIMEOUT = 60
+
+
+# Upper bound on simultaneous LinkedIn requests; the unofficial API is
+# aggressively rate-limited, so keep this small
+LINKEDIN_MAX_CONCURRENCY = int(os.environ.get("LINKEDIN_MAX_CONCURRENCY", 4))
+
+# Worker threads shared by every blocking LinkedIn call
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=LINKEDIN_MAX_CONCURRENCY,
+    thread_name_prefix="linkedin"
+)
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+# Results per LinkedIn search page; larger searches fetch pages concurrently
+SEARCH_PAGE_SIZE = 25
+
+# On-disk cache of job details; postings rarely change within a day
+JOB_CACHE_DIR = os.path.join("tmp", "linkedin_jobs")
+JOB_CACHE_TTL = 24 * 60 * 60
+JOB_CACHE_SIZE_LIMIT = 100 * 1024 * 1024
+
+_job_cache: Optional[diskcache.Cache] = None
+_job_cache_lock = threading.Lock()
+
+# Placeholder details for jobs that could not be fetched
+_EMPTY_JOB = MappingProxyType({
+    "company_name": 'N/A',
+    "company_url": 'N/A',
+    "job_desc_text": 'N/A',
+    "work_remote_allowed": False,
+    "job_title": 'N/A',
+    "company_apply_url": 'N/A',
+    "job_location": 'N/A'
+})
+
+# Mapping of job types to LinkedIn API codes
+_JOB_TYPE_MAP = {
+    "full-time": "F",
+    "contract": "C",
+    "part-time": "P",
+    "temporary": "T",
+    "internship": "I",
+    "volunteer": "V",
+    "other": "O"
+}
 
 
-# Initialize LinkedIn API client with credentials from environment variables
-try:
-    api = Linkedin(os.environ["LINKEDIN_EMAIL"], os.environ["LINKEDIN_PASS"])
-    print("LinkedIn API initialized successfully")
-except KeyError as e:
-    print(f"Missing required environment variable: {e}")
-    api = None
-except Exception as e:
-    print(f"Error initializing LinkedIn API: {str(e)}")
-    api = None
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter applying a default timeout to every request.
+    
+    linkedin-api issues its requests without a timeout, so a stalled
+    connection would otherwise block a job search indefinitely.
+    """
+    
+    def __init__(self, *args, timeout=LINKEDIN_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=timeout or self.timeout, **kwargs)
+
+
+async def _run_blocking(func, *args, **kwargs):
+    """
+    Run a blocking LinkedIn call on the shared worker pool.
+    
+    All LinkedIn requests go through the same LINKEDIN_MAX_CONCURRENCY
+    threads, so concurrent searches and job fetches together never exceed
+    that many requests in flight.
+    
+    Args:
+        func: Blocking callable to run
+        *args: Positional arguments for `func`
+        **kwargs: Keyword arguments for `func`
+        
+    Returns:
+        The return value of `func`
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, partial(func, *args, **kwargs))
+
+
+def _linkedin_api() -> Optional[Linkedin]:
+    """
+    Log in to LinkedIn on first use and return the shared API client.
+    
+    Logging in is a blocking HTTP round trip, so it is deferred until a job
+    search actually needs it rather than paid on every import. The outcome,
+    including a failed login, is cached so that later calls neither repeat
+    the login nor trigger LinkedIn's lockouts with retries. Calls that
+    arrive while the login is in flight wait for it instead of starting
+    logins of their own.
+    
+    Returns:
+        Optional[Linkedin]: API client, or None if credentials are missing
+        or the login failed
+    """
+    with _linkedin_login_lock:
+        return _linkedin_login()
+
+
+# lru_cache does not stop concurrent first calls from all running the
+# function, so the login is only ever entered under this lock
+_linkedin_login_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _linkedin_login() -> Optional[Linkedin]:
+    """Log in to LinkedIn; memoized, and called only by _linkedin_api."""
+    try:
+        email, password = os.environ["LINKEDIN_EMAIL"], os.environ["LINKEDIN_PASS"]
+        
+        # Mount the timeout adapter before any request is made
+        api = Linkedin(email, password, authenticate=False)
+        api.client.session.mount("https://", _TimeoutHTTPAdapter())
+        
+        # linkedin-api sends its login requests through module-level requests
+        # calls that bypass the session and its adapter, so the login runs on
+        # a daemon thread and is abandoned if it stalls, instead of holding a
+        # worker of the shared pool forever
+        login = Future()
+        
+        def authenticate() -> None:
+            try:
+                api.client.authenticate(email, password)
+                login.set_result(api)
+            except Exception as e:
+                login.set_exception(e)
+        
+        threading.Thread(target=authenticate, name="linkedin-login", daemon=True).start()
+        login.result(timeout=LINKEDIN_LOGIN_TIMEOUT)
+        
+        logger.info("LinkedIn API initialized successfully")
+        return api
+    except KeyError as e:
+        logger.warning("Missing required environment variable: %s", e)
+    except TimeoutError:
+        logger.error("LinkedIn login timed out after %ds", LINKEDIN_LOGIN_TIMEOUT)
+    except Exception as e:
+        logger.error("Error initializing LinkedIn API: %s", e)
+    return None
 
 
 def get_job_type(job_type: str) -> Optional[str]:
@@ -55,19 +201,8 @@ def get_job_type(job_type: str) -> Optional[str]:
         >>> get_job_type("internship")
         'I'
     """
-    # Mapping of job types to LinkedIn API codes
-    job_type_mapping = {
-        "full-time": "F",
-        "contract": "C", 
-        "part-time": "P",
-        "temporary": "T",
-        "internship": "I",
-        "volunteer": "V",
-        "other": "O"
-    }
-    
     # Return the mapped code, case-insensitive lookup
-    return job_type_mapping.get(job_type.lower())
+    return _JOB_TYPE_MAP.get(job_type.lower())
 
 
 def get_job_ids(
@@ -77,7 +212,8 @@ def get_job_ids(
     limit: int = 10,
     companies: Optional[List[str]] = None,
     industries: Optional[List[str]] = None,
-    remote: Optional[str] = None
+    remote: Optional[str] = None,
+    offset: int = 0
 ) -> List[str]:
     """
     Search for job postings on LinkedIn and return job IDs.
@@ -93,6 +229,7 @@ def get_job_ids(
         companies (Optional[List[str]]): List of company names to filter by
         industries (Optional[List[str]]): List of industries to filter by
         remote (Optional[str]): Remote work preference
+        offset (int): Number of leading search results to skip (default: 0)
         
     Returns:
         List[str]: List of job IDs for detailed retrieval
@@ -100,6 +237,7 @@ def get_job_ids(
     Raises:
         Exception: If LinkedIn API is not initialized or search fails
     """
+    api = _linkedin_api()
     if api is None:
         raise Exception("LinkedIn API not initialized. Check credentials.")
     
@@ -107,14 +245,11 @@ def get_job_ids(
     if job_type is not None:
         job_type = get_job_type(job_type)
     
-    print(f"Searching jobs with parameters:")
-    print(f"  Keywords: {keywords}")
-    print(f"  Location: {location_name}")
-    print(f"  Job Type: {job_type}")
-    print(f"  Limit: {limit}")
-    print(f"  Companies: {companies}")
-    print(f"  Industries: {industries}")
-    print(f"  Remote: {remote}")
+    logger.debug(
+        "Searching jobs: keywords=%s location=%s job_type=%s limit=%s "
+        "companies=%s industries=%s remote=%s offset=%s",
+        keywords, location_name, job_type, limit, companies, industries, remote, offset
+    )
 
     try:
         # Perform job search using LinkedIn API
@@ -125,37 +260,95 @@ def get_job_ids(
             companies=companies,
             industries=industries,
             remote=remote,
-            limit=limit
+            limit=limit,
+            offset=offset
         )
         
-        # Extract job IDs from tracking URNs
-        # LinkedIn returns tracking URNs in format "jobPosting:XXXXXXXX"
+        # Extract job IDs from tracking URNs with one scan per URN
+        # LinkedIn returns tracking URNs in format "urn:li:jobPosting:XXXXXXXX";
+        # rpartition leaves the separator slot empty for any other URN
         job_ids = [
-            job['trackingUrn'].split('jobPosting:')[1] 
-            for job in job_postings 
-            if 'trackingUrn' in job and 'jobPosting:' in job['trackingUrn']
+            urn_parts[2]
+            for job in job_postings
+            if (urn_parts := job.get('trackingUrn', '').rpartition('jobPosting:'))[1]
         ]
         
-        print(f"Found {len(job_ids)} job postings")
+        logger.debug("Found %d job postings", len(job_ids))
         return job_ids
         
     except Exception as e:
-        print(f"Error searching for jobs: {str(e)}")
+        logger.error("Error searching for jobs: %s", e)
         return []
 
 
-async def get_job_details(job_id: str) -> Dict[str, Any]:
+async def get_job_ids_parallel(
+    keywords: str,
+    location_name: str,
+    job_type: Optional[str] = None,
+    limit: int = 10,
+    companies: Optional[List[str]] = None,
+    industries: Optional[List[str]] = None,
+    remote: Optional[str] = None,
+    page_size: int = SEARCH_PAGE_SIZE
+) -> List[str]:
+    """
+    Search for job postings with result pages requested concurrently.
+    
+    LinkedIn returns search results in pages, which a single search_jobs
+    call fetches one after another. For limits above `page_size` the range
+    is split up front and every page is requested at the same time on
+    the shared LinkedIn worker pool. Small searches make a single request as before.
+    
+    Args:
+        keywords (str): Search keywords for job titles/descriptions
+        location_name (str): Geographic location for job search
+        job_type (Optional[str]): Type of job (full-time, contract, etc.)
+        limit (int): Maximum number of jobs to return (default: 10)
+        companies (Optional[List[str]]): List of company names to filter by
+        industries (Optional[List[str]]): List of industries to filter by
+        remote (Optional[str]): Remote work preference
+        page_size (int): Number of results requested per page
+        
+    Returns:
+        List[str]: Job IDs in search result order, without duplicates
+    """
+    filters = dict(
+        keywords=keywords,
+        location_name=location_name,
+        job_type=job_type,
+        companies=companies,
+        industries=industries,
+        remote=remote
+    )
+    
+    # Log in once up front rather than from every page request at once
+    await _run_blocking(_linkedin_api)
+    
+    pages = await asyncio.gather(*(
+        _run_blocking(get_job_ids, **filters, limit=min(page_size, limit - offset), offset=offset)
+        for offset in range(0, limit, page_size)
+    ))
+    
+    # Pages can overlap if new postings shift the results between requests
+    job_ids = list(dict.fromkeys(job_id for page in pages for job_id in page))
+    return job_ids[:limit]
+
+
+async def get_job_details(job_id: str, use_cache: bool = True) -> Mapping[str, Any]:
     """
     Retrieve detailed information for a specific job posting.
     
     This async function fetches comprehensive job details from LinkedIn
     including company information, job description, location, and application URL.
+    Successful lookups are cached on disk for a day, so repeated searches do
+    not hit the rate-limited LinkedIn API again.
     
     Args:
         job_id (str): LinkedIn job ID to fetch details for
+        use_cache (bool): Read and write the job details cache (default: True)
         
     Returns:
-        Dict[str, Any]: Dictionary containing job details with the following keys:
+        Mapping[str, Any]: Dictionary containing job details with the following keys:
             - company_name: Name of the hiring company
             - company_url: Company's LinkedIn URL
             - job_desc_text: Full job description text
@@ -164,12 +357,23 @@ async def get_job_details(job_id: str) -> Dict[str, Any]:
             - company_apply_url: Direct application URL
             - job_location: Job location information
     """
+    # The cache is SQLite on disk, so it is read and written on the worker
+    # pool rather than on the event loop; a hit needs no LinkedIn login
+    cache_key = hashlib.sha256(job_id.encode()).hexdigest()
+    if use_cache:
+        cached = await _run_blocking(lambda: _get_job_cache().get(cache_key))
+        if cached is not None:
+            return cached
+    
+    # Usually already logged in by the search; otherwise this waits for it
+    api = await _run_blocking(_linkedin_api)
     if api is None:
         return _get_empty_job_dict()
     
     try:
-        # Fetch job data from LinkedIn API
-        job_data = api.get_job(job_id)
+        # Fetch job data from LinkedIn API. The client is synchronous, so the
+        # request runs on the shared worker pool to let concurrent fetches overlap
+        job_data = await _run_blocking(api.get_job, job_id)
         
         # Safely extract nested data with fallbacks
         company_details = job_data.get('companyDetails', {})
@@ -192,69 +396,177 @@ async def get_job_details(job_id: str) -> Dict[str, Any]:
             "job_location": job_data.get('formattedLocation', 'N/A')
         }
         
-        print(f"Successfully fetched details for job: {job_data_dict.get('job_title', 'Unknown')}")
+        logger.debug("Fetched details for job %s: %s", job_id, job_data_dict["job_title"])
+        
+        if use_cache:
+            await _run_blocking(
+                lambda: _get_job_cache().set(cache_key, job_data_dict, expire=JOB_CACHE_TTL)
+            )
         return job_data_dict
         
     except Exception as e:
-        print(f"Error fetching job details for job ID {job_id}: {str(e)}")
+        logger.warning("Error fetching job details for job ID %s: %s", job_id, e)
         return _get_empty_job_dict()
 
 
-def _get_empty_job_dict() -> Dict[str, str]:
+def _get_job_cache() -> diskcache.Cache:
     """
-    Return an empty job dictionary structure for error cases.
+    Get the on-disk job details cache, opening it on first use.
     
     Returns:
-        Dict[str, str]: Empty job data structure with default values
+        diskcache.Cache: Cache evicting least recently used entries once it
+        exceeds JOB_CACHE_SIZE_LIMIT bytes
     """
-    return {
-        "company_name": 'N/A',
-        "company_url": 'N/A',
-        "job_desc_text": 'N/A',
-        "work_remote_allowed": False,
-        "job_title": 'N/A',
-        "company_apply_url": 'N/A',
-        "job_location": 'N/A'
-    }
+    global _job_cache
+    
+    # Job fetches on several worker threads may get here at once
+    with _job_cache_lock:
+        if _job_cache is None:
+            _job_cache = diskcache.Cache(
+                JOB_CACHE_DIR,
+                size_limit=JOB_CACHE_SIZE_LIMIT,
+                eviction_policy="least-recently-used"
+            )
+            _job_cache.stats(enable=True)
+    return _job_cache
+
+
+def get_job_cache_stats() -> Dict[str, int]:
+    """
+    Get hit and miss counts for the job details cache.
+    
+    Returns:
+        Dict[str, int]: Cache hits, misses and number of stored jobs
+    """
+    cache = _get_job_cache()
+    hits, misses = cache.stats()
+    return {'hits': hits, 'misses': misses, 'entries': len(cache)}
+
+
+def _get_empty_job_dict() -> Mapping[str, Any]:
+    """
+    Return the empty job structure used for error cases.
+    
+    The same read-only instance is returned every time, so a burst of
+    failed fetches does not allocate a dictionary per job. Callers that
+    need to modify it must copy it with `dict(...)` first.
+    
+    Returns:
+        Mapping[str, Any]: Read-only empty job data with default values
+    """
+    return _EMPTY_JOB
 
 
-async def fetch_all_jobs(job_ids: List[str], batch_size: int = 10) -> List[Dict[str, Any]]:
+@dataclass
+class JobBatch:
+    """
+    Column-oriented collection of job details.
+    
+    Each field holds one column, with index i of every column describing the
+    same job. Batches are built by appending job detail dictionaries and are
+    rendered for the agents in a single pass over the columns.
+    
+    Attributes:
+        company_name (List[str]): Names of the hiring companies
+        company_url (List[str]): Companies' LinkedIn URLs
+        job_desc_text (List[str]): Full job description texts
+        work_remote_allowed (List[bool]): Whether remote work is allowed
+        job_title (List[str]): Titles of the job positions
+        company_apply_url (List[str]): Direct application URLs
+        job_location (List[str]): Job location information
+    """
+    company_name: List[str] = field(default_factory=list)
+    company_url: List[str] = field(default_factory=list)
+    job_desc_text: List[str] = field(default_factory=list)
+    work_remote_allowed: List[bool] = field(default_factory=list)
+    job_title: List[str] = field(default_factory=list)
+    company_apply_url: List[str] = field(default_factory=list)
+    job_location: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.job_title)
+    
+    def append(self, job: Mapping[str, Any]) -> None:
+        """
+        Add one job detail dictionary as a new row.
+        
+        Args:
+            job (Mapping[str, Any]): Job details as returned by get_job_details
+        """
+        for column in fields(self):
+            getattr(self, column.name).append(job[column.name])
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Convert the batch back into one dictionary per job.
+        
+        Returns:
+            List[Dict[str, Any]]: Job detail dictionaries in batch order
+        """
+        names = [column.name for column in fields(self)]
+        columns = [getattr(self, name) for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+    
+    def to_prompt(self) -> str:
+        """
+        Render every job as a plain-text block for the agents' context.
+        
+        Returns:
+            str: One block per job, separated by blank lines
+        """
+        return "\n\n".join(
+            f"Job Title: {title}\n"
+            f"Company: {company} ({company_url})\n"
+            f"Location: {location}\n"
+            f"Remote Work: {'Yes' if remote else 'No'}\n"
+            f"Apply URL: {apply_url}\n"
+            f"Description: {description}"
+            for title, company, company_url, location, remote, apply_url, description in zip(
+                self.job_title, self.company_name, self.company_url, self.job_location,
+                self.work_remote_allowed, self.company_apply_url, self.job_desc_text
+            )
+        )
+
+
+async def fetch_all_jobs(job_ids: List[str], batch_size: int = 10) -> JobBatch:
     """
     Fetch detailed information for multiple job postings.
     
-    This function processes a list of job IDs and retrieves detailed information
-    for each one. It can process jobs in batches to manage API rate limits.
+    This function retrieves detailed information for every job ID
+    concurrently, with at most `batch_size` requests in flight at once to
+    respect API rate limits. Results keep the order of `job_ids`.
     
     Args:
         job_ids (List[str]): List of LinkedIn job IDs
-        batch_size (int): Number of jobs to process in each batch (currently not used)
+        batch_size (int): Maximum number of concurrent job detail requests
         
     Returns:
-        List[Dict[str, Any]]: List of job detail dictionaries
-        
-    Note:
-        Currently processes jobs sequentially. Batch processing can be implemented
-        for better performance and rate limit management.
+        JobBatch: Job details in the order of `job_ids`
     """
-    results = []
     total_jobs = len(job_ids)
+    semaphore = asyncio.Semaphore(batch_size)
     
-    print(f"Fetching details for {total_jobs} jobs...")
+    logger.debug("Fetching details for %d jobs", total_jobs)
     
-    for index, job_id in enumerate(job_ids, 1):
-        print(f"Processing job {index}/{total_jobs}: {job_id}")
-        
-        job_detail = await get_job_details(job_id)
-        results.append(job_detail)
-        
-        # Optional: Add delay between requests to respect rate limits
-        # await asyncio.sleep(0.5)
+    async def _fetch_limited(job_id: str) -> Mapping[str, Any]:
+        async with semaphore:
+            return await get_job_details(job_id)
+    
+    results = await asyncio.gather(
+        *(_fetch_limited(job_id) for job_id in job_ids),
+        return_exceptions=True
+    )
+    
+    # A failed job falls back to the empty structure instead of failing the batch
+    batch = JobBatch()
+    for result in results:
+        batch.append(_get_empty_job_dict() if isinstance(result, Exception) else result)
     
-    print(f"Completed fetching details for {len(results)} jobs")
-    return results
+    logger.debug("Completed fetching details for %d jobs", len(batch))
+    return batch
 
 
-async def job_threads(job_ids: List[str]) -> List[Dict[str, Any]]:
+async def job_threads(job_ids: List[str]) -> JobBatch:
     """
     Main entry point for fetching multiple job details asynchronously.
     
@@ -265,7 +577,7 @@ async def job_threads(job_ids: List[str]) -> List[Dict[str, Any]]:
         job_ids (List[str]): List of LinkedIn job IDs to process
         
     Returns:
-        List[Dict[str, Any]]: List of detailed job information dictionaries
+        JobBatch: Detailed job information for every job ID
     """
     return await fetch_all_jobs(job_ids, batch_size=10)
 
@@ -6,24 +6,79 @@ This module defines the specialized tools used by different agents:
 - job_pipeline: LinkedIn job search functionality
 - extract_cv: CV content extraction and analysis
 - generate_letter_for_specific_job: Cover letter generation
+- generate_letters_for_jobs: Cover letters for several jobs in one LLM call
 
 Each tool is decorated with @tool to make it compatible with LangChain agents.
 """
 
 from ast import List
+from contextvars import ContextVar
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 from langchain.agents import tool
-from data_loader import load_cv, write_to_docx
-from search import job_threads, get_job_ids
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
+from langchain_core.outputs import ChatGeneration
+from data_loader import CVBundle, segment_cv, write_to_docx
+from search import fetch_all_jobs, get_job_ids_parallel
+from llms import ConcurrentInferenceEngine, load_llm, load_embeddings
+from prompts import COVER_LETTER_MARKER, COVER_LETTER_PROMPT, COVER_LETTERS_BATCH_PROMPT, CV_SECTION_PROMPT
+from cache import CacheManager
 import asyncio
+import hashlib
+from dataclasses import asdict, dataclass
+import json
+import logging
+import os
+import re
 from langchain.pydantic_v1 import BaseModel, Field
 
 
+logger = logging.getLogger(__name__)
+
+# The uploaded CV with its text and sections, built once per upload by the
+# app and handed over without a disk write. Each graph run sets it in its
+# own context, so concurrent sessions never see each other's CV
+current_cv_bundle: ContextVar[Optional[CVBundle]] = ContextVar("current_cv_bundle", default=None)
+
+# Cover letters are reused for the same CV, company and job title, and a
+# near-identical job posting
+LETTER_CACHE_THRESHOLD = 0.92
+LETTER_CACHE_MAX_JOBS = 64
+
+# Semantic letter caches, one per CV and job (keyed by a hash of the CV
+# text, company name and job title)
+_letter_caches: dict = {}
+
+# "Job Title: ..." and "Company: ... (url)" lines of JobBatch.to_prompt,
+# or the same fields as JSON keys
+_JOB_TITLE_FIELD = re.compile(r'\bjob[ _]title\W*[:=]\s*"?([^"\n]+)', re.IGNORECASE)
+_COMPANY_FIELD = re.compile(r'\bcompany(?:[ _]name)?\W*[:=]\s*"?([^"(\n]+)', re.IGNORECASE)
+
+# CVs longer than this are condensed per section before writing a letter;
+# shorter ones fit comfortably in a single prompt
+SECTIONED_LETTER_MIN_CHARS = 6000
+
+# Sections read against the job; 'other' (contact details, profile) is
+# short and passed through as is
+_HIGHLIGHT_SECTIONS = ('experience', 'skills', 'education')
+
+# Splits a batched completion on its <<<LETTER k>>> markers
+_LETTER_MARKER = re.compile(r'<<<LETTER (\d+)>>>')
+
+# Agents the alternative routing tool chooses between by default
+ROUTE_MEMBERS = ("Analyzer", "Generator", "Searcher")
+
+
 # ==============================================
 # JOB SEARCH TOOLS
 # ==============================================
 
 @tool
-def job_pipeline(
+async def job_pipeline(
     keywords: str, 
     location_name: str, 
     job_type: str = None, 
@@ -31,12 +86,13 @@ def job_pipeline(
     companies: str = None, 
     industries: str = None, 
     remote: str = None
-) -> dict:
+) -> str:
     """
     Comprehensive LinkedIn job search tool that finds and retrieves detailed job postings.
     
     This tool combines job ID retrieval with detailed job information fetching
-    to provide complete job listings for analysis.
+    to provide complete job listings for analysis. It runs on the agent's
+    event loop; the blocking LinkedIn search pages run on worker threads.
     
     Parameters:
     -----------
@@ -58,8 +114,8 @@ def job_pipeline(
     
     Returns:
     --------
-    dict
-        Dictionary containing comprehensive job information:
+    str
+        One text block per job containing comprehensive job information:
         - job_title: Position title
         - company_name: Hiring company
         - company_url: Company profile URL
@@ -73,10 +129,10 @@ def job_pipeline(
     This tool uses the unofficial LinkedIn API and may be subject to rate limits
     or terms of service restrictions.
     """
-    print(f"Searching jobs with criteria: {keywords} in {location_name}")
+    logger.debug("Searching jobs with criteria: %s in %s", keywords, location_name)
     
     # Step 1: Get job IDs based on search criteria
-    job_ids = get_job_ids(
+    job_ids = await get_job_ids_parallel(
         keywords=keywords,
         location_name=location_name, 
         job_type=job_type,
@@ -86,31 +142,54 @@ def job_pipeline(
         remote=remote
     )
     
-    print(f"Found {len(job_ids)} job IDs: {job_ids}")
+    logger.debug("Found %d job IDs: %s", len(job_ids), job_ids)
     
-    # Step 2: Fetch detailed information for each job
-    job_descriptions = asyncio.run(job_threads(job_ids))
+    # Step 2: Fetch detailed information for each job concurrently, keeping
+    # LinkedIn's ranking so the best matches come first in the prompt
+    jobs = await fetch_all_jobs(job_ids)
+    logger.debug("Fetched details for %d jobs", len(jobs))
     
-    return job_descriptions
+    return jobs.to_prompt()
 
 
 # ==============================================
 # CV ANALYSIS TOOLS
 # ==============================================
 
+@dataclass(slots=True, frozen=True)
+class CVResult:
+    """
+    Result of the CV extraction tool.
+    
+    Attributes:
+    -----------
+    content : str
+        Full extracted text from the CV, or an error message
+    """
+    content: str
+    
+    def __str__(self) -> str:
+        # The text itself is what ends up in the Analyzer's prompt
+        return self.content
+    
+    def to_dict(self) -> dict:
+        """Return the result in the former {'content': ...} form."""
+        return asdict(self)
+
+
 @tool("extractor_tool", return_direct=False)
-def extract_cv() -> dict:
+async def extract_cv() -> CVResult:
     """
     Extract and structure job-relevant information from an uploaded CV/resume.
     
-    This tool reads the CV file from the temporary directory and extracts
+    This tool reads the CV uploaded in the current session and extracts
     key information relevant for job applications while maintaining privacy
     by focusing on professional qualifications rather than personal details.
     
     Returns:
     --------
-    dict
-        Dictionary containing structured CV information:
+    CVResult
+        Structured CV information:
         - content: Full extracted text from the CV
         
     Key Features:
@@ -122,23 +201,46 @@ def extract_cv() -> dict:
     
     Note:
     -----
-    Expects CV file to be saved as 'tmp/cv.pdf' by the upload handler.
+    Returns the text of the CV bundle built by the upload handler for the
+    current run, so the PDF is not parsed again.
     """
-    print("Extracting CV content from uploaded file...")
+    # The upload handler already extracted the CV: nothing left to do
+    bundle = current_cv_bundle.get()
+    if bundle is None:
+        logger.error("Error extracting CV: no CV set for this run")
+        return CVResult("Error: Could not extract CV content")
     
-    # Initialize result structure
-    cv_extracted_json = {}
+    logger.debug("Extracted %d characters from CV", len(bundle.text))
+    return CVResult(bundle.text)
+
+
+def set_cv_bundle(bundle: Optional[CVBundle]) -> None:
+    """
+    Store the processed CV for the tools of the current graph run.
+    
+    The bundle is held in a context variable, so it is visible to the tools
+    the calling task runs (and to the tasks and worker threads it starts)
+    but not to runs of other sessions. Call it inside the coroutine that
+    drives the graph, which runs in a context of its own.
     
-    # Load and extract text from PDF CV
-    try:
-        text = load_cv("tmp/cv.pdf")
-        cv_extracted_json['content'] = text
-        print(f"Successfully extracted {len(text)} characters from CV")
-    except Exception as e:
-        print(f"Error extracting CV: {str(e)}")
-        cv_extracted_json['content'] = "Error: Could not extract CV content"
+    Parameters:
+    -----------
+    bundle : Optional[CVBundle]
+        CV bundle built at upload time by load_cv_bundle, or None to clear it
+    """
+    current_cv_bundle.set(bundle)
+
+
+def get_cv_bundle() -> Optional[CVBundle]:
+    """
+    Return the processed CV of the current graph run.
     
-    return cv_extracted_json
+    Returns:
+    --------
+    Optional[CVBundle]
+        CV bundle set for this run, or None if no CV was uploaded yet
+    """
+    return current_cv_bundle.get()
 
 
 # ==============================================
@@ -146,7 +248,7 @@ def extract_cv() -> dict:
 # ==============================================
 
 @tool
-def generate_letter_for_specific_job(cv_details: str, job_details: str) -> str:
+async def generate_letter_for_specific_job(cv_details: str, job_details: str) -> str:
     """
     Generate a tailored cover letter using provided CV and job details.
     
@@ -178,25 +280,364 @@ def generate_letter_for_specific_job(cv_details: str, job_details: str) -> str:
     
     Prompt Template:
     ---------------
-    Based on the CV details provided in {cv_details} and the job requirements 
-    listed in {job_details}, write a personalized cover letter. Ensure the 
-    letter articulates how the applicant's skills and experiences align with 
-    the job requirements.
+    SYSTEM: static letter-writing instructions (COVER_LETTER_INSTRUCTIONS)
+    CV: {cv_details}
+    JOB: {job_details}
+    Write the cover letter for this job.
     
-    The generated letter should:
+    The stable parts come first, so letters for several jobs from the same
+    CV share one cacheable prompt prefix. CVs of SECTIONED_LETTER_MIN_CHARS
+    or more are first split into experience, skills and education, and each
+    section is condensed against the job by its own smaller call, all in
+    parallel; the letter is then written from those highlights. The
+    generated letter should:
     - Open with enthusiasm for the specific role
     - Highlight 2-3 most relevant qualifications
     - Demonstrate knowledge of the company
     - Close with a strong call to action
     - Maintain professional yet engaging tone
     """
-    print("Generating personalized cover letter...")
-    print(f"CV Details Length: {len(str(cv_details))}")
-    print(f"Job Details Length: {len(str(job_details))}")
+    logger.debug(
+        "Generating cover letter (CV details: %d chars, job details: %d chars)",
+        len(str(cv_details)), len(str(job_details))
+    )
+    
+    cv_text = _stable_text(cv_details)
+    job_text = _stable_text(job_details)
+    
+    # Retrying the same job, or a near-duplicate posting of it, reuses the letter
+    letter_cache = _letter_cache(cv_text, job_details)
+    if letter_cache is not None:
+        cached = await asyncio.to_thread(
+            letter_cache.get_cache, job_text, LETTER_CACHE_THRESHOLD
+        )
+        if cached is not None:
+            logger.debug("Reusing cached cover letter for a matching job")
+            return cached
+    
+    # Long CVs are reduced to their job-relevant points first, one parallel
+    # call per section, so the letter prompt stays small
+    letter_cv_text = cv_text
+    if len(cv_text) >= SECTIONED_LETTER_MIN_CHARS:
+        letter_cv_text = await _cv_highlights(cv_text, job_text)
     
-    # Note: The actual generation logic is handled by the LLM agent
-    # This tool serves as the interface and parameter structure
-    return f"Cover letter generation initiated with CV and job details."
+    letter = await _stream_text(
+        COVER_LETTER_PROMPT, _letter_llm(),
+        {"cv_details": letter_cv_text, "job_details": job_text}
+    )
+    
+    if letter_cache is not None:
+        letter_cache.put_cache_async(job_text, letter)
+    return letter
+
+
+@tool
+async def generate_letters_for_jobs(cv_details: str, jobs: list[str]) -> list[str]:
+    """
+    Generate one tailored cover letter per job from a single LLM call.
+    
+    Use this instead of generate_letter_for_specific_job when letters are
+    needed for several jobs: the CV is sent once and all letters come back
+    in one completion, instead of one round trip per job.
+    
+    Parameters:
+    -----------
+    cv_details : str
+        Structured information from the candidate's CV including skills,
+        experience, education, and achievements
+    jobs : list[str]
+        Job posting details, one entry per job
+    
+    Returns:
+    --------
+    list[str]
+        Cover letters in the same order as `jobs`
+    """
+    logger.debug("Generating cover letters for %d jobs", len(jobs))
+    
+    cv_text = _stable_text(cv_details)
+    job_texts = [_stable_text(job) for job in jobs]
+    letters = [None] * len(job_texts)
+    
+    # Serve what the letter caches already have; only the rest are generated
+    letter_caches = [_letter_cache(cv_text, job) for job in jobs]
+    cached = [index for index, letter_cache in enumerate(letter_caches) if letter_cache is not None]
+    hits = await asyncio.gather(*(
+        asyncio.to_thread(letter_caches[index].get_cache, job_texts[index], LETTER_CACHE_THRESHOLD)
+        for index in cached
+    ))
+    for index, letter in zip(cached, hits):
+        letters[index] = letter
+    
+    missing = [index for index, letter in enumerate(letters) if letter is None]
+    if not missing:
+        return letters
+    
+    job_blocks = "\n\n".join(
+        f"{COVER_LETTER_MARKER.format(index=number)}\nJOB:\n{job_texts[index]}"
+        for number, index in enumerate(missing, 1)
+    )
+    completion = await _stream_text(COVER_LETTERS_BATCH_PROMPT, _letter_llm(), {
+        "cv_details": cv_text,
+        "job_blocks": job_blocks,
+        "first_marker": COVER_LETTER_MARKER.format(index=1)
+    })
+    
+    generated = _split_letters(completion, len(missing))
+    for index, letter in zip(missing, generated):
+        letters[index] = letter
+        if letter_caches[index] is not None and letter:
+            letter_caches[index].put_cache_async(job_texts[index], letter)
+    
+    return letters
+
+
+async def _stream_text(prompt, llm, inputs: dict) -> str:
+    """
+    Run a prompt through a chat model in streaming mode and return the text.
+    
+    Streaming makes the model emit each token to the callbacks as it is
+    generated, so the UI shows the first words of a letter almost at once
+    instead of after the whole completion. The callbacks are inherited from
+    the tool's run (the app passes its Streamlit handler in the graph
+    config), and the tool result is still the full text the agent needs.
+    
+    LangChain only consults a model's response cache on invoke and batch;
+    `astream` always calls the provider. The model's cache is therefore
+    checked here, with the same key LangChain uses, before streaming, and
+    filled afterwards. A cached letter is returned whole, without tokens.
+    
+    Parameters:
+    -----------
+    prompt : ChatPromptTemplate
+        Letter prompt
+    llm : BaseChatModel
+        Model that writes the text
+    inputs : dict
+        Prompt variables for the prompt
+        
+    Returns:
+    --------
+    str
+        The concatenated chunks
+    """
+    response_cache = llm.cache if isinstance(llm.cache, BaseCache) else None
+    if response_cache is not None:
+        messages = (await prompt.ainvoke(inputs)).to_messages()
+        cache_key, llm_string = dumps(messages), llm._get_llm_string()
+        cached = await response_cache.alookup(cache_key, llm_string)
+        if cached:
+            return "".join(generation.text for generation in cached)
+    
+    chunks = []
+    async for chunk in (prompt | llm | StrOutputParser()).astream(inputs):
+        chunks.append(chunk)
+    text = "".join(chunks)
+    
+    if response_cache is not None:
+        await response_cache.aupdate(
+            cache_key, llm_string, [ChatGeneration(message=AIMessage(content=text))]
+        )
+    return text
+
+
+def _split_letters(completion: str, count: int) -> list:
+    """
+    Split a batched completion into its individual letters.
+    
+    Parameters:
+    -----------
+    completion : str
+        Model output containing letters introduced by <<<LETTER k>>> markers
+    count : int
+        Number of letters requested
+        
+    Returns:
+    --------
+    list
+        `count` letters in marker order; letters the model skipped are empty
+    """
+    letters = [""] * count
+    
+    # re.split yields [preamble, number, letter, number, letter, ...]
+    parts = _LETTER_MARKER.split(completion)
+    for number, text in zip(parts[1::2], parts[2::2]):
+        position = int(number) - 1
+        if 0 <= position < count:
+            letters[position] = text.strip()
+    
+    return letters
+
+
+async def _cv_highlights(cv_text: str, job_text: str) -> str:
+    """
+    Condense a CV to the points relevant to a job, section by section.
+    
+    Each of the experience, skills and education sections is sent with the
+    job in its own request, and the requests run concurrently. Small
+    contexts keep the model from overlooking details buried in the middle
+    of a long CV and finish faster than one large request.
+    
+    Parameters:
+    -----------
+    cv_text : str
+        Full CV text
+    job_text : str
+        Job posting details
+        
+    Returns:
+    --------
+    str
+        The CV's 'other' section followed by the highlights of each section,
+        or the full CV if it has no recognizable sections
+    """
+    # The uploaded CV was already sectioned when its bundle was built
+    bundle = current_cv_bundle.get()
+    if bundle is not None and bundle.text.strip() == cv_text:
+        sections = bundle.sections
+    else:
+        sections = segment_cv(cv_text)
+    names = [name for name in _HIGHLIGHT_SECTIONS if name in sections]
+    if not names:
+        return cv_text
+    
+    requests = [
+        CV_SECTION_PROMPT.format_messages(
+            section=name, section_text=sections[name], job_details=job_text
+        )
+        for name in names
+    ]
+    replies = await ConcurrentInferenceEngine(_letter_llm()).infer_batch(requests)
+    
+    parser = JsonOutputParser()
+    parts = [sections['other']] if 'other' in sections else []
+    for name, reply in zip(names, replies):
+        try:
+            highlights = parser.parse(reply.content).get("highlights", [])
+        except Exception:
+            # Unparseable reply: keep the section rather than lose it
+            parts.append(f"{name.title()}:\n{sections[name]}")
+            continue
+        if highlights:
+            parts.append(f"{name.title()}:\n" + "\n".join(f"- {point}" for point in highlights))
+    
+    return "\n\n".join(parts)
+
+
+def _letter_llm():
+    """
+    Get the chat model that writes cover letters.
+    
+    LETTER_LLM_NAME selects a separate provider for letters, e.g. 'vllm' to
+    offload them to a self-hosted server while the agents keep using
+    LLM_NAME; by default letters use the agents' provider.
+    
+    Returns:
+    --------
+    BaseChatModel
+        The configured provider's model (cached by load_llm)
+    """
+    return load_llm(os.environ.get("LETTER_LLM_NAME") or os.environ.get("LLM_NAME", "openai"))
+
+
+def _letter_cache(cv_text: str, job_details) -> Optional[CacheManager]:
+    """
+    Get the semantic cache of letters written for a CV and job.
+    
+    The CV, company name and job title must match exactly (by hash); only
+    postings within that are compared by embedding similarity. Templated
+    postings of different companies are near-identical as text, so
+    similarity alone would hand one company's letter to another. Caches for
+    the least recently added jobs are dropped once more than
+    LETTER_CACHE_MAX_JOBS are held.
+    
+    Parameters:
+    -----------
+    cv_text : str
+        Normalized CV details the letters are written from
+    job_details : Any
+        Job details as passed by the agent
+        
+    Returns:
+    --------
+    Optional[CacheManager]
+        Letter cache for this CV and job, or None if the provider has no
+        embeddings
+    """
+    company, title = _job_identity(job_details)
+    cache_key = hashlib.blake2b(
+        "\0".join((cv_text, company, title)).encode(), digest_size=16
+    ).hexdigest()
+    if cache_key in _letter_caches:
+        return _letter_caches[cache_key]
+    
+    embeddings = load_embeddings(os.environ.get("LLM_NAME", "openai"))
+    if embeddings is None:
+        return None
+    
+    if len(_letter_caches) >= LETTER_CACHE_MAX_JOBS:
+        _letter_caches.pop(next(iter(_letter_caches)))
+    
+    # Letters are long-lived and accumulate per job, so their embeddings are
+    # kept as int8; the 0.92 threshold is far coarser than the ~1e-3 error
+    _letter_caches[cache_key] = CacheManager(embeddings, quantize=True)
+    return _letter_caches[cache_key]
+
+
+def _job_identity(job_details) -> tuple:
+    """
+    Get the company name and job title a cover letter is addressed to.
+    
+    Parameters:
+    -----------
+    job_details : Any
+        Job details as passed by the agent: a job dictionary, or text such
+        as a JobBatch.to_prompt block or JSON
+        
+    Returns:
+    --------
+    tuple
+        (company, title), case- and whitespace-normalized. If either is not
+        found, the whole job text stands in for the title, so only an
+        identical posting can match.
+    """
+    if isinstance(job_details, dict):
+        company = job_details.get('company_name') or ''
+        title = job_details.get('job_title') or ''
+    else:
+        text = str(job_details)
+        company_match = _COMPANY_FIELD.search(text)
+        title_match = _JOB_TITLE_FIELD.search(text)
+        company = company_match.group(1) if company_match else ''
+        title = title_match.group(1) if title_match else ''
+    
+    company = ' '.join(str(company).split()).casefold()
+    title = ' '.join(str(title).split()).casefold()
+    if not company or not title:
+        return company, _stable_text(job_details)
+    return company, title
+
+
+def _stable_text(value) -> str:
+    """
+    Serialize tool input to text that is byte-identical across calls.
+    
+    Structured values are dumped as JSON with sorted keys so dictionary
+    ordering never changes the prompt prefix; strings are only stripped.
+    
+    Parameters:
+    -----------
+    value : Any
+        CV or job details as passed by the agent
+        
+    Returns:
+    --------
+    str
+        Normalized text for the cover letter prompt
+    """
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return str(value).strip()
 
 
 # ==============================================
@@ -212,7 +653,7 @@ def get_tools() -> list:
     list
         List of all tool functions available for agent use
     """
-    return [job_pipeline, extract_cv, generate_letter_for_specific_job]
+    return [job_pipeline, extract_cv, generate_letter_for_specific_job, generate_letters_for_jobs]
 
 
 # ==============================================
@@ -220,7 +661,7 @@ def get_tools() -> list:
 # ==============================================
 
 @tool
-def func_alternative_tool(msg: str, members: list) -> dict:
+def func_alternative_tool(msg: str, members: Optional[list] = None) -> Mapping:
     """
     Alternative routing tool for experimental configurations.
     
@@ -231,40 +672,63 @@ def func_alternative_tool(msg: str, members: list) -> dict:
     -----------
     msg : str
         Message or query to route
-    members : list
-        Available agent members for routing
+    members : Optional[list]
+        Available agent members for routing; defaults to ROUTE_MEMBERS
         
     Returns:
     --------
-    dict
-        Function definition for routing decisions
+    Mapping
+        Read-only function definition for routing decisions, shared between
+        calls with the same members (copy it before modifying)
         
     Note:
     -----
     This tool is currently experimental and not used in the main workflow.
     It's kept for potential future routing strategy alternatives.
     """
-    members = ["Analyzer", "Generator", "Searcher"]
-    options = ["FINISH"] + members
+    # The default team, and any team seen before, reuse a prebuilt schema
+    if members is None or tuple(members) == ROUTE_MEMBERS:
+        return _ROUTE_SCHEMA
+    return _route_schema(tuple(members))
+
+
+@lru_cache(maxsize=8)
+def _route_schema(members: tuple) -> Mapping:
+    """
+    Build the read-only routing schema for a team of agents.
     
-    # Function definition for routing schema
-    function_def = {
+    Parameters:
+    -----------
+    members : tuple
+        Agent names the supervisor can route to
+        
+    Returns:
+    --------
+    Mapping
+        Function definition whose `next` enum is FINISH plus `members`;
+        nested mappings are read-only and lists are tuples
+    """
+    options = ("FINISH",) + members
+    
+    return MappingProxyType({
         "name": "route",
         "description": "Select the next role.",
-        "parameters": {
+        "parameters": MappingProxyType({
             "title": "routeSchema",
             "type": "object",
-            "properties": {
-                "next": {
+            "properties": MappingProxyType({
+                "next": MappingProxyType({
                     "title": "Next",
-                    "anyOf": [{"enum": options}],
-                }
-            },
-            "required": ["next"],
-        },
-    }
-    
-    return function_def
+                    "anyOf": (MappingProxyType({"enum": options}),),
+                })
+            }),
+            "required": ("next",),
+        }),
+    })
+
+
+# Routing schema for the default team, built once at import
+_ROUTE_SCHEMA = _route_schema(ROUTE_MEMBERS)
 
 
 # ==============================================
@@ -314,9 +778,9 @@ Analyzer Agent:
 - Output: Structured CV information highlighting relevant skills
 
 Generator Agent:
-- Uses: generate_letter_for_specific_job
+- Uses: generate_letter_for_specific_job, generate_letters_for_jobs
 - Purpose: Create personalized cover letters
-- Output: Tailored cover letter text
+- Output: Tailored cover letter text, written by the tool's own LLM call
 
 Error Handling:
 ==============
@@ -327,7 +791,8 @@ Error Handling:
 Performance Considerations:
 ==========================
 - LinkedIn API has rate limits - tool respects these automatically
-- CV extraction is synchronous but fast for typical resume sizes
-- Job fetching uses async operations for better performance
+- The CV is parsed once per upload into the session's CV bundle, which each
+  graph run hands to the tools through a context variable
+- Job search and fetching run as async tools on the agent's event loop
 - Large job searches may take several seconds to complete
 """
\ No newline at end of file